@@ -3,7 +3,8 @@ AWS Service Client Factory - Reusable AWS service client factory with regional m
 """
 import logging
 import asyncio
-from typing import Optional, Dict, Any, List, Set, Union, TypeVar, Generic
+import threading
+from typing import Optional, Dict, Any, FrozenSet, Iterable, List, Set, Tuple, Union, TypeVar, Generic
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
@@ -21,7 +22,7 @@ from botocore.exceptions import (
 )
 
 from app.models.aws import AWSSessionError, AWSProfileNotFoundError
-from app.aws.session_manager import AWSSessionManager, get_session_manager
+from app.aws.session_manager import AWSSessionManager, get_session_manager_instance
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -29,6 +30,13 @@ logger = logging.getLogger(__name__)
 # Type variable for boto3 clients
 ClientType = TypeVar('ClientType')
 
+# Global services, reachable from every region regardless of endpoint data
+GLOBAL_SERVICES = frozenset({'iam', 'cloudfront', 'route53', 's3'})
+
+# Config settings _merge_configs carries over; clients built with a caller
+# config are cached apart from default clients by these values
+CLIENT_CONFIG_CACHE_ATTRS = ('retries', 'max_pool_connections', 'tcp_keepalive', 'connect_timeout', 'read_timeout')
+
 
 class AWSServiceType(str, Enum):
     """Supported AWS service types"""
@@ -111,13 +119,15 @@ class AWSClientCacheEntry:
         profile_name: str,
         region: str,
         service_name: str,
-        ttl_minutes: int = 60
+        ttl_minutes: int = 60,
+        config_key: str = ""
     ):
         self.client = client
         self.created_at = created_at
         self.profile_name = profile_name
         self.region = region
         self.service_name = service_name
+        self.config_key = config_key
         self.expires_at = created_at + timedelta(minutes=ttl_minutes)
     
     @property
@@ -128,7 +138,13 @@ class AWSClientCacheEntry:
     @property
     def cache_key(self) -> str:
         """Generate cache key for this entry"""
-        return f"{self.profile_name}:{self.region}:{self.service_name}"
+        return _client_cache_key(self.profile_name, self.region, self.service_name, self.config_key)
+
+
+def _client_cache_key(profile_name: str, region: str, service_name: str, config_key: str = "") -> str:
+    """Build the client cache key, suffixed with the config key for non-default configs"""
+    cache_key = f"{profile_name}:{region}:{service_name}"
+    return f"{cache_key}:{config_key}" if config_key else cache_key
 
 
 class AWSServiceClientFactory:
@@ -152,19 +168,23 @@ class AWSServiceClientFactory:
         Args:
             session_manager: Optional session manager instance
         """
-        self.session_manager = session_manager or get_session_manager()
+        self.session_manager = session_manager or get_session_manager_instance()
         self.client_cache: Dict[str, AWSClientCacheEntry] = {}
         self.executor = ThreadPoolExecutor(max_workers=10)
-        self.service_availability_cache: Dict[str, Dict[str, RegionAvailability]] = {}
+        # Service -> (sorted available regions, region set). Built from the endpoint
+        # data bundled with botocore, which is static for the life of the process
+        self.service_region_table: Dict[str, Tuple[Tuple[str, ...], FrozenSet[str]]] = {}
         self.max_cached_clients = 200
         
-        # Default boto3 config with retry logic
+        # Default boto3 config with retry logic. TCP keepalive stops idle pooled
+        # connections being dropped, so cached clients keep reusing them
         self.default_config = Config(
             retries={
                 'max_attempts': 3,
                 'mode': 'adaptive'
             },
             max_pool_connections=50,
+            tcp_keepalive=True,
             connect_timeout=10,
             read_timeout=60
         )
@@ -205,8 +225,9 @@ class AWSServiceClientFactory:
         profile_name = profile_name or "default"
         region = region or "us-east-1"
         
-        # Generate cache key
-        cache_key = f"{profile_name}:{region}:{service_name}"
+        # Generate cache key; clients with a caller config are cached separately
+        config_key = self._config_cache_key(config)
+        cache_key = _client_cache_key(profile_name, region, service_name, config_key)
         
         # Check cache first (unless force refresh)
         if not force_refresh and cache_key in self.client_cache:
@@ -238,7 +259,7 @@ class AWSServiceClientFactory:
             )
             
             # Cache the client
-            self._cache_client(client, profile_name, region, service_name)
+            self._cache_client(client, profile_name, region, service_name, config_key)
             
             logger.info(f"Created {service_name} client for profile '{profile_name}' in region '{region}'")
             return client
@@ -247,6 +268,114 @@ class AWSServiceClientFactory:
             logger.error(f"Failed to create {service_name} client: {str(e)}")
             raise AWSServiceError(f"Client creation failed: {str(e)}") from e
     
+    def peek_client(
+        self,
+        service_name: Union[str, AWSServiceType],
+        profile_name: Optional[str] = None,
+        region: Optional[str] = None
+    ) -> Optional[Any]:
+        """
+        Get a cached client without creating one
+        
+        Args:
+            service_name: AWS service name or AWSServiceType enum
+            profile_name: AWS profile name
+            region: AWS region
+            
+        Returns:
+            The cached client, or None if none is cached or it has expired
+        """
+        if isinstance(service_name, AWSServiceType):
+            service_name = service_name.value
+        
+        cache_entry = self.client_cache.get(_client_cache_key(profile_name or 'default', region or 'us-east-1', service_name))
+        if cache_entry and not cache_entry.is_expired:
+            return cache_entry.client
+        return None
+    
+    async def get_clients(
+        self,
+        service_names: List[str],
+        profile_name: Optional[str] = None,
+        region: Optional[str] = None,
+        config: Optional[Config] = None
+    ) -> Dict[str, Any]:
+        """
+        Get clients for several services from a single session
+        
+        Cached clients built with the same config are reused. Missing clients
+        are created together from one session without a test operation, for
+        callers that immediately exercise the clients themselves.
+        
+        Args:
+            service_names: AWS service names
+            profile_name: AWS profile name
+            region: AWS region
+            config: Optional boto3 Config object for newly created clients
+            
+        Returns:
+            Clients keyed by service name
+            
+        Raises:
+            AWSServiceError: If client creation fails
+        """
+        profile_name = profile_name or "default"
+        region = region or "us-east-1"
+        
+        config_key = self._config_cache_key(config)
+        clients = {}
+        missing_services = []
+        for service_name in service_names:
+            cache_entry = self.client_cache.get(_client_cache_key(profile_name, region, service_name, config_key))
+            if cache_entry and not cache_entry.is_expired:
+                clients[service_name] = cache_entry.client
+            else:
+                missing_services.append(service_name)
+        
+        if missing_services:
+            try:
+                session = await self.session_manager.get_session(profile_name, region)
+                final_config = self._merge_configs(config, {})
+                created_clients = await asyncio.get_running_loop().run_in_executor(
+                    self.executor,
+                    lambda: [
+                        self.session_manager.create_client(session, name, config=final_config)
+                        for name in missing_services
+                    ]
+                )
+            except Exception as e:
+                logger.error(f"Failed to create {', '.join(missing_services)} clients: {str(e)}")
+                raise AWSServiceError(f"Client creation failed: {str(e)}") from e
+            
+            for service_name, client in zip(missing_services, created_clients):
+                self._cache_client(client, profile_name, region, service_name, config_key)
+                clients[service_name] = client
+            
+            logger.info(f"Created {', '.join(missing_services)} clients for profile '{profile_name}' in region '{region}'")
+        
+        return clients
+    
+    async def call(self, client: Any, operation: str, **kwargs) -> Any:
+        """
+        Invoke a client operation without blocking the event loop
+        
+        Operations run on the factory's executor, which is sized alongside the
+        clients' connection pools, rather than the loop's default executor.
+        
+        Args:
+            client: AWS service client
+            operation: Client operation name (e.g. 'list_buckets')
+            **kwargs: Operation parameters
+            
+        Returns:
+            Operation response
+        """
+        method = getattr(client, operation)
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            lambda: method(**kwargs)
+        )
+    
     async def get_resource(
         self,
         service_name: Union[str, AWSServiceType],
@@ -285,7 +414,7 @@ class AWSServiceClientFactory:
             # Create resource
             resource = await asyncio.get_event_loop().run_in_executor(
                 self.executor,
-                lambda: session.resource(service_name, config=final_config, **kwargs)
+                lambda: self.session_manager.create_resource(session, service_name, config=final_config, **kwargs)
             )
             
             logger.info(f"Created {service_name} resource for profile '{profile_name}' in region '{region}'")
@@ -310,39 +439,11 @@ class AWSServiceClientFactory:
         Returns:
             RegionAvailability status
         """
-        # Check cache first
-        cache_key = f"{service_name}:{region}"
-        if cache_key in self.service_availability_cache:
-            cached_result = self.service_availability_cache[cache_key]
-            # Cache availability for 24 hours
-            if 'cached_at' in cached_result and \
-               (datetime.utcnow() - cached_result['cached_at']).total_seconds() < 86400:
-                return cached_result['availability']
-        
         try:
-            # Get list of available regions for the service
-            session = boto3.Session()
-            available_regions = session.get_available_regions(service_name)
-            
-            if region in available_regions:
-                availability = RegionAvailability.AVAILABLE
-            else:
-                # Check for special cases (global services)
-                if service_name in ['iam', 'cloudfront', 'route53', 's3']:
-                    availability = RegionAvailability.AVAILABLE
-                else:
-                    availability = RegionAvailability.UNAVAILABLE
-            
-            # Cache the result
-            if service_name not in self.service_availability_cache:
-                self.service_availability_cache[service_name] = {}
-            
-            self.service_availability_cache[service_name][region] = {
-                'availability': availability,
-                'cached_at': datetime.utcnow()
-            }
-            
-            return availability
+            # Pure table lookup once the service has been loaded
+            if region in self._get_service_region_entry(service_name)[1] or service_name in GLOBAL_SERVICES:
+                return RegionAvailability.AVAILABLE
+            return RegionAvailability.UNAVAILABLE
             
         except Exception as e:
             logger.warning(f"Could not check availability for {service_name} in {region}: {str(e)}")
@@ -359,9 +460,7 @@ class AWSServiceClientFactory:
             List of available regions
         """
         try:
-            session = boto3.Session()
-            regions = session.get_available_regions(service_name)
-            return sorted(regions)
+            return list(self._get_service_regions(service_name))
         except Exception as e:
             logger.warning(f"Could not get available regions for {service_name}: {str(e)}")
             return []
@@ -375,8 +474,7 @@ class AWSServiceClientFactory:
         """
         try:
             # Use EC2 to get all regions since it's available in all regions
-            session = boto3.Session()
-            return sorted(session.get_available_regions('ec2'))
+            return list(self._get_service_regions('ec2'))
         except Exception as e:
             logger.warning(f"Could not get all regions: {str(e)}")
             # Fallback to known regions
@@ -387,6 +485,54 @@ class AWSServiceClientFactory:
                 'ap-northeast-2', 'ca-central-1', 'sa-east-1'
             ]
     
+    def warm_service_region_table(self, service_names: Iterable[str]) -> None:
+        """
+        Load region metadata for services ahead of their first availability check
+        
+        Blocking: reads botocore's bundled endpoint and service data.
+        
+        Args:
+            service_names: AWS service names to load
+        """
+        session = boto3.Session()
+        for service_name in service_names:
+            if service_name not in self.service_region_table:
+                self._get_service_region_entry(service_name, session)
+    
+    def _get_service_regions(self, service_name: str) -> Tuple[str, ...]:
+        """
+        Get the sorted regions a service is available in
+        
+        Args:
+            service_name: AWS service name
+            
+        Returns:
+            Sorted available regions
+        """
+        return self._get_service_region_entry(service_name)[0]
+    
+    def _get_service_region_entry(
+        self,
+        service_name: str,
+        session: Optional[boto3.Session] = None
+    ) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+        """
+        Get the region table entry for a service, loading it from botocore on first use
+        
+        Args:
+            service_name: AWS service name
+            session: Optional boto3 session to read endpoint data with
+            
+        Returns:
+            Tuple of (sorted available regions, region set)
+        """
+        entry = self.service_region_table.get(service_name)
+        if entry is None:
+            regions = tuple(sorted((session or boto3.Session()).get_available_regions(service_name)))
+            entry = (regions, frozenset(regions))
+            self.service_region_table[service_name] = entry
+        return entry
+    
     def cleanup_expired_clients(self) -> int:
         """
         Clean up expired clients from cache
@@ -452,7 +598,7 @@ class AWSServiceClientFactory:
             try:
                 client = await asyncio.get_event_loop().run_in_executor(
                     self.executor,
-                    lambda: session.client(service_name, config=config)
+                    lambda: self.session_manager.create_client(session, service_name, config=config)
                 )
                 
                 # Test the client with a simple operation if possible
@@ -546,7 +692,7 @@ class AWSServiceClientFactory:
                 merged_dict['retries'] = merged_config.retries
             
             # Merge other config attributes
-            for attr in ['max_pool_connections', 'connect_timeout', 'read_timeout']:
+            for attr in ['max_pool_connections', 'tcp_keepalive', 'connect_timeout', 'read_timeout']:
                 value = getattr(config, attr, None) or getattr(merged_config, attr, None)
                 if value is not None:
                     merged_dict[attr] = value
@@ -555,12 +701,28 @@ class AWSServiceClientFactory:
         
         return merged_config
     
+    def _config_cache_key(self, config: Optional[Config]) -> str:
+        """
+        Get the cache key part identifying a caller-provided client config
+        
+        Args:
+            config: Optional user-provided Config
+            
+        Returns:
+            Empty string for the default config, otherwise the merged settings
+        """
+        if config is None:
+            return ""
+        merged_config = self._merge_configs(config, {})
+        return repr(tuple(getattr(merged_config, attr, None) for attr in CLIENT_CONFIG_CACHE_ATTRS))
+    
     def _cache_client(
         self,
         client: Any,
         profile_name: str,
         region: str,
-        service_name: str
+        service_name: str,
+        config_key: str = ""
     ) -> None:
         """
         Cache client with automatic cleanup if needed
@@ -570,6 +732,7 @@ class AWSServiceClientFactory:
             profile_name: AWS profile name
             region: AWS region
             service_name: AWS service name
+            config_key: Key of a non-default client config
         """
         # Clean up expired clients first
         self.cleanup_expired_clients()
@@ -588,7 +751,8 @@ class AWSServiceClientFactory:
             created_at=datetime.utcnow(),
             profile_name=profile_name,
             region=region,
-            service_name=service_name
+            service_name=service_name,
+            config_key=config_key
         )
         
         self.client_cache[cache_entry.cache_key] = cache_entry
@@ -601,22 +765,36 @@ class AWSServiceError(AWSSessionError):
 
 # Global client factory instance
 _client_factory: Optional[AWSServiceClientFactory] = None
+_client_factory_lock = threading.Lock()
 
 
-def get_client_factory() -> AWSServiceClientFactory:
-    """Get global client factory instance"""
+def get_client_factory_instance() -> AWSServiceClientFactory:
+    """Get global client factory instance from synchronous code"""
     global _client_factory
     if _client_factory is None:
-        _client_factory = AWSServiceClientFactory()
+        # Double-checked so concurrent first calls build a single factory
+        with _client_factory_lock:
+            if _client_factory is None:
+                _client_factory = AWSServiceClientFactory()
     return _client_factory
 
 
+async def get_client_factory() -> AWSServiceClientFactory:
+    """
+    Get global client factory instance
+    
+    Declared async so FastAPI resolves it on the event loop; sync dependencies
+    are run in the threadpool on every request.
+    """
+    return get_client_factory_instance()
+
+
 async def cleanup_clients_periodically():
     """Background task to clean up expired clients"""
     while True:
         try:
             await asyncio.sleep(300)  # Clean up every 5 minutes
-            factory = get_client_factory()
+            factory = await get_client_factory()
             cleaned = factory.cleanup_expired_clients()
             if cleaned > 0:
                 logger.debug(f"Cleaned up {cleaned} expired AWS clients")
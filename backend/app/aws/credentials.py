@@ -6,7 +6,7 @@ import logging
 from pathlib import Path
 from configparser import ConfigParser, Error as ConfigParserError
 from typing import Optional, Dict, Any, List, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from app.models.aws import (
     AWSProfile, 
@@ -47,11 +47,17 @@ class AWSCredentialsReader:
         self.credentials_file = self.aws_dir / "credentials"
         self.config_file = self.aws_dir / "config"
         
-        # Cache for file contents
+        # Parsed file contents, each reused until its file's fingerprint changes
         self._credentials_cache: Optional[ConfigParser] = None
+        self._credentials_cache_fingerprint: Optional[Tuple[Optional[int], ...]] = None
         self._config_cache: Optional[ConfigParser] = None
+        self._config_cache_fingerprint: Optional[Tuple[Optional[int], ...]] = None
         self._cache_timestamp: Optional[datetime] = None
-        self._cache_ttl = timedelta(minutes=5)  # Cache for 5 minutes
+        self._file_parse_count = 0
+        
+        # Parsed profiles, reused until either file's fingerprint changes
+        self._profiles_cache: Optional[AWSProfileCollection] = None
+        self._profiles_cache_fingerprint: Optional[Tuple[Optional[int], ...]] = None
         
         logger.debug(f"AWS credentials reader initialized with directory: {self.aws_dir}")
     
@@ -65,13 +71,6 @@ class AWSCredentialsReader:
         home_dir = Path.home()
         return home_dir / ".aws"
     
-    def _should_refresh_cache(self) -> bool:
-        """Check if cache should be refreshed"""
-        if not self._cache_timestamp:
-            return True
-        
-        return datetime.now() - self._cache_timestamp > self._cache_ttl
-    
     def _read_ini_file(self, file_path: Path) -> ConfigParser:
         """
         Read and parse an INI file safely
@@ -90,6 +89,7 @@ class AWSCredentialsReader:
             return ConfigParser()
         
         try:
+            self._file_parse_count += 1
             config = ConfigParser()
             config.read(file_path, encoding='utf-8')
             logger.debug(f"Successfully read AWS file: {file_path}")
@@ -101,18 +101,22 @@ class AWSCredentialsReader:
     
     def _load_credentials_file(self) -> ConfigParser:
         """Load and cache the credentials file"""
-        if self._credentials_cache is None or self._should_refresh_cache():
+        fingerprint = self._get_file_fingerprint(self.credentials_file)
+        if self._credentials_cache is None or fingerprint != self._credentials_cache_fingerprint:
             logger.debug("Loading AWS credentials file")
             self._credentials_cache = self._read_ini_file(self.credentials_file)
+            self._credentials_cache_fingerprint = fingerprint
             self._cache_timestamp = datetime.now()
         
         return self._credentials_cache
     
     def _load_config_file(self) -> ConfigParser:
         """Load and cache the config file"""
-        if self._config_cache is None or self._should_refresh_cache():
+        fingerprint = self._get_file_fingerprint(self.config_file)
+        if self._config_cache is None or fingerprint != self._config_cache_fingerprint:
             logger.debug("Loading AWS config file")
             self._config_cache = self._read_ini_file(self.config_file)
+            self._config_cache_fingerprint = fingerprint
             self._cache_timestamp = datetime.now()
         
         return self._config_cache
@@ -328,9 +332,19 @@ class AWSCredentialsReader:
         """
         Read all AWS profiles
         
+        The parsed collection is reused until the credentials or config file
+        is modified, so callers must not mutate it.
+        
         Returns:
             AWSProfileCollection with all profiles
         """
+        files_fingerprint = self.get_files_fingerprint()
+        if self._profiles_cache is not None and files_fingerprint == self._profiles_cache_fingerprint:
+            logger.debug("Using cached AWS profiles")
+            return self._profiles_cache
+        
+        # Files changed (or first read); parsed file contents are reused when
+        # still current, e.g. after get_profile_names
         logger.info("Reading all AWS profiles")
         collection = AWSProfileCollection()
         
@@ -348,8 +362,23 @@ class AWSCredentialsReader:
         
         logger.info(f"Successfully loaded {collection.profile_count} profiles "
                    f"({collection.valid_profile_count} valid)")
+        
+        self._profiles_cache = collection
+        self._profiles_cache_fingerprint = files_fingerprint
         return collection
     
+    def get_cached_profiles(self) -> Optional[AWSProfileCollection]:
+        """
+        Get the parsed profiles without reading the files
+        
+        Returns:
+            The collection read_all_profiles would return, or None if the
+            files changed (or were never read) and must be parsed again
+        """
+        if self._profiles_cache is not None and self.get_files_fingerprint() == self._profiles_cache_fingerprint:
+            return self._profiles_cache
+        return None
+    
     def validate_profile(self, profile_name: str) -> Tuple[bool, Optional[str]]:
         """
         Validate a specific profile
@@ -427,18 +456,82 @@ class AWSCredentialsReader:
             logger.warning(f"Could not determine region for profile {profile_name}: {e}")
             return settings.AWS_DEFAULT_REGION
     
+    def get_effective_regions(self, profile_names: List[str]) -> Dict[str, str]:
+        """
+        Get the effective regions for several profiles (with inheritance)
+        
+        Resolves every profile against one parsed profile collection rather
+        than re-reading each profile in the chain, as get_effective_region does.
+        
+        Args:
+            profile_names: Profile names
+            
+        Returns:
+            Region for each profile name
+        """
+        profiles = self.read_all_profiles()
+        regions = {}
+        
+        for profile_name in profile_names:
+            region = None
+            visited = set()
+            current_profile = profile_name
+            
+            # Follow source profiles until one sets a region; stop on cycles
+            while current_profile and current_profile not in visited:
+                visited.add(current_profile)
+                profile = profiles.get_profile(current_profile)
+                if profile is None:
+                    break
+                if profile.region:
+                    region = profile.region
+                    break
+                current_profile = profile.source_profile
+            
+            # Fall back to default region from settings
+            regions[profile_name] = region or settings.AWS_DEFAULT_REGION
+        
+        return regions
+    
     def clear_cache(self) -> None:
         """Clear the file cache"""
         self._credentials_cache = None
+        self._credentials_cache_fingerprint = None
         self._config_cache = None
+        self._config_cache_fingerprint = None
         self._cache_timestamp = None
+        self._profiles_cache = None
+        self._profiles_cache_fingerprint = None
         logger.debug("AWS credentials cache cleared")
     
+    def get_files_fingerprint(self) -> Tuple[Optional[int], ...]:
+        """
+        Get a fingerprint of the credentials and config files
+        
+        Built from one stat call per file, so checking it costs the same
+        however large the files are. Nanosecond mtimes catch edits within the
+        same second, and size and inode catch files replaced by a rename.
+        
+        Returns:
+            Flat tuple of (mtime_ns, size, inode) for the credentials file then
+            the config file, with None values for a missing file
+        """
+        return self._get_file_fingerprint(self.credentials_file) + self._get_file_fingerprint(self.config_file)
+    
+    @staticmethod
+    def _get_file_fingerprint(file_path: Path) -> Tuple[Optional[int], ...]:
+        """Get (mtime_ns, size, inode) for a file, or None values if it is missing"""
+        try:
+            stat = file_path.stat()
+            return stat.st_mtime_ns, stat.st_size, stat.st_ino
+        except OSError:
+            return None, None, None
+    
     def get_cache_info(self) -> Dict[str, Any]:
         """Get cache information for debugging"""
         return {
             "cache_enabled": True,
-            "cache_ttl_minutes": self._cache_ttl.total_seconds() / 60,
+            "file_parses": self._file_parse_count,
             "last_cached": self._cache_timestamp.isoformat() if self._cache_timestamp else None,
             "credentials_file_exists": self.credentials_file.exists(),
             "config_file_exists": self.config_file.exists(),
@@ -5,6 +5,9 @@ import os
 import uuid
 import logging
 import asyncio
+import threading
+import time
+import weakref
 from pathlib import Path
 from typing import Optional, Dict, Any, Tuple, List
 from datetime import datetime, timedelta
@@ -12,6 +15,7 @@ from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 import botocore.exceptions
+from botocore.config import Config
 from botocore.credentials import RefreshableCredentials
 from botocore.session import get_session
 
@@ -22,6 +26,7 @@ from app.models.aws import (
     AWSProfileType,
     AWSSessionError,
     AWSSessionExpiredError,
+    AWSRoleAssumptionError,
     AWSCredentialError,
     AWSProfileNotFoundError
 )
@@ -30,6 +35,27 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Fail fast on credential validation: one attempt with tight timeouts, so a
+# slow or unreachable profile cannot hold up callers validating many profiles
+VALIDATION_CLIENT_CONFIG = Config(
+    connect_timeout=2,
+    read_timeout=3,
+    retries={'max_attempts': 1}
+)
+
+# Sessions expiring within this many minutes are refreshed by the background prefetch task
+SESSION_PREFETCH_MINUTES = 10
+
+# Sessions expiring within this many minutes are refreshed on the request path
+SESSION_STALE_MINUTES = 2
+
+# Seconds between background prefetch passes
+SESSION_PREFETCH_INTERVAL_SECONDS = 60
+
+# Seconds a recorded STS caller identity answers validate_credentials before
+# STS is asked again, so revoked credentials stop validating soon after
+IDENTITY_CACHE_SECONDS = 60
+
 
 class AWSSessionManager:
     """
@@ -55,6 +81,14 @@ class AWSSessionManager:
         """
         self.credentials_reader = credentials_reader or AWSCredentialsReader()
         self.session_cache = AWSSessionCache()
+        # Cached session ID -> boto3 session, reused while the cached session lives
+        self._boto3_sessions: Dict[str, boto3.Session] = {}
+        # Cached session ID -> (monotonic time, STS caller identity) of its last validation
+        self._session_identities: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # boto3 sessions are not thread-safe, so clients are created from each one
+        # at a time; locks are dropped along with their sessions
+        self._session_locks: "weakref.WeakKeyDictionary[boto3.Session, threading.Lock]" = weakref.WeakKeyDictionary()
+        self._session_locks_guard = threading.Lock()
         self.executor = ThreadPoolExecutor(max_workers=5)
         self._default_session_duration = 3600  # 1 hour
         
@@ -81,6 +115,29 @@ class AWSSessionManager:
             AWSProfileNotFoundError: If profile doesn't exist
             AWSSessionError: If session creation fails
         """
+        aws_session = await self._get_cached_session(profile_name, region, force_refresh)
+        return self._get_boto3_session(aws_session)
+    
+    async def _get_cached_session(
+        self,
+        profile_name: Optional[str] = None,
+        region: Optional[str] = None,
+        force_refresh: bool = False
+    ) -> AWSSession:
+        """
+        Get the cached session for a profile, creating and validating a new one when needed
+        
+        Sessions are reused until they are within SESSION_STALE_MINUTES of expiry;
+        the background prefetch task normally refreshes them before that.
+        
+        Args:
+            profile_name: AWS profile name (defaults to 'default')
+            region: AWS region (defaults to profile region or us-east-1)
+            force_refresh: Force creation of new session
+            
+        Returns:
+            AWSSession: Cached session information
+        """
         profile_name = profile_name or "default"
         
         try:
@@ -89,26 +146,35 @@ class AWSSessionManager:
             region = region or profile.region or "us-east-1"
             
             # Check cache for existing session
-            if not force_refresh:
-                cached_session = self.session_cache.get_session_by_profile(profile_name, region)
-                if cached_session and not cached_session.should_refresh():
-                    logger.debug(f"Using cached session for profile: {profile_name}")
-                    return await self._create_boto3_session_from_cached(cached_session)
+            cached_session = self.session_cache.get_session_by_profile(profile_name, region)
+            if (
+                not force_refresh
+                and cached_session
+                and not cached_session.should_refresh(threshold_minutes=SESSION_STALE_MINUTES)
+            ):
+                logger.debug(f"Using cached session for profile: {profile_name}")
+                return cached_session
             
             # Create new session
             logger.info(f"Creating new AWS session for profile: {profile_name}, region: {region}")
             session = await self._create_new_session(profile, region)
             
+            # Validate session before caching it, keeping the caller identity for validate_credentials
+            boto3_session = self._create_boto3_session_from_cached(session)
+            identity = await self._validate_session(boto3_session)
+            
             # Cache the session
             self.session_cache.add_session(session)
+            self._boto3_sessions[session.session_id] = boto3_session
+            self._session_identities[session.session_id] = (time.monotonic(), identity)
             
-            # Create boto3 session
-            boto3_session = await self._create_boto3_session_from_cached(session)
-            
-            # Validate session
-            await self._validate_session(boto3_session)
+            # Retire the session this one replaces so profile lookups find the new one
+            if cached_session:
+                self.session_cache.remove_session(cached_session.session_id)
+                self._boto3_sessions.pop(cached_session.session_id, None)
+                self._session_identities.pop(cached_session.session_id, None)
             
-            return boto3_session
+            return session
             
         except Exception as e:
             logger.error(f"Failed to get session for profile {profile_name}: {str(e)}")
@@ -136,7 +202,10 @@ class AWSSessionManager:
             AWS service client
         """
         session = await self.get_session(profile_name, region)
-        return session.client(service_name, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            lambda: self.create_client(session, service_name, **kwargs)
+        )
     
     async def get_resource(
         self, 
@@ -158,7 +227,54 @@ class AWSSessionManager:
             AWS service resource
         """
         session = await self.get_session(profile_name, region)
-        return session.resource(service_name, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            lambda: self.create_resource(session, service_name, **kwargs)
+        )
+    
+    def create_client(self, session: boto3.Session, service_name: str, **kwargs) -> Any:
+        """
+        Create a client from a session returned by get_session
+        
+        Sessions are shared between callers, so creation is serialized per
+        session. This blocks, so call it from an executor thread.
+        
+        Args:
+            session: boto3 session from get_session
+            service_name: AWS service name
+            **kwargs: Additional client configuration
+            
+        Returns:
+            AWS service client
+        """
+        with self._get_session_lock(session):
+            return session.client(service_name, **kwargs)
+    
+    def create_resource(self, session: boto3.Session, service_name: str, **kwargs) -> Any:
+        """
+        Create a resource from a session returned by get_session
+        
+        Sessions are shared between callers, so creation is serialized per
+        session. This blocks, so call it from an executor thread.
+        
+        Args:
+            session: boto3 session from get_session
+            service_name: AWS service name
+            **kwargs: Additional resource configuration
+            
+        Returns:
+            AWS service resource
+        """
+        with self._get_session_lock(session):
+            return session.resource(service_name, **kwargs)
+    
+    def _get_session_lock(self, session: boto3.Session) -> threading.Lock:
+        """Get the lock serializing client and resource creation from a boto3 session"""
+        with self._session_locks_guard:
+            lock = self._session_locks.get(session)
+            if lock is None:
+                lock = self._session_locks[session] = threading.Lock()
+            return lock
     
     async def assume_role(
         self,
@@ -194,7 +310,10 @@ class AWSSessionManager:
         try:
             # Get source session
             source_session = await self.get_session(source_profile, region)
-            sts_client = source_session.client('sts')
+            sts_client = await asyncio.get_running_loop().run_in_executor(
+                self.executor,
+                lambda: self.create_client(source_session, 'sts')
+            )
             
             # Prepare assume role parameters
             assume_role_params = {
@@ -248,7 +367,7 @@ class AWSSessionManager:
             
         except Exception as e:
             logger.error(f"Failed to assume role {role_arn}: {str(e)}")
-            raise AWSSessionError(f"Role assumption failed: {str(e)}") from e
+            raise AWSRoleAssumptionError(f"Role assumption failed: {str(e)}") from e
     
     async def validate_credentials(
         self, 
@@ -266,14 +385,17 @@ class AWSSessionManager:
             Dict with validation results
         """
         try:
-            session = await self.get_session(profile_name, region)
-            sts_client = session.client('sts')
-            
-            # Get caller identity to validate credentials
-            identity = await asyncio.get_event_loop().run_in_executor(
-                self.executor,
-                sts_client.get_caller_identity
-            )
+            # Sessions are validated against STS when created, so a cached session
+            # answers from its recorded caller identity for IDENTITY_CACHE_SECONDS
+            aws_session = await self._get_cached_session(profile_name, region)
+            validated = self._session_identities.get(aws_session.session_id)
+            if validated and time.monotonic() - validated[0] < IDENTITY_CACHE_SECONDS:
+                identity = validated[1]
+            else:
+                # Drop the stale identity so a failed re-check cannot be answered from it
+                self._session_identities.pop(aws_session.session_id, None)
+                identity = await self._validate_session(self._get_boto3_session(aws_session))
+                self._session_identities[aws_session.session_id] = (time.monotonic(), identity)
             
             return {
                 'valid': True,
@@ -312,6 +434,34 @@ class AWSSessionManager:
             logger.error(f"Failed to refresh credentials for {profile_name}: {str(e)}")
             return False
     
+    async def prefetch_expiring_sessions(self) -> int:
+        """
+        Refresh cached profile sessions that expire within SESSION_PREFETCH_MINUTES
+        
+        Returns:
+            int: Number of sessions refreshed
+        """
+        expiring = {
+            (session.profile_name, session.region)
+            for session in list(self.session_cache.sessions.values())
+            if not session.is_expired and session.should_refresh(threshold_minutes=SESSION_PREFETCH_MINUTES)
+        }
+        
+        refreshed = 0
+        for profile_name, region in expiring:
+            try:
+                await self._get_cached_session(profile_name, region, force_refresh=True)
+                refreshed += 1
+            except AWSProfileNotFoundError:
+                # Sessions from direct role assumption have no profile to refresh from
+                continue
+            except Exception as e:
+                logger.warning(f"Could not prefetch session for profile {profile_name}: {str(e)}")
+        
+        if refreshed > 0:
+            logger.info(f"Prefetched {refreshed} expiring sessions")
+        return refreshed
+    
     def cleanup_expired_sessions(self) -> int:
         """
         Clean up expired sessions from cache
@@ -441,7 +591,7 @@ class AWSSessionManager:
             session = boto3.Session(profile_name=profile.name, region_name=region)
             
             # Test the session immediately to ensure SSO login is valid
-            sts_client = session.client('sts')
+            sts_client = session.client('sts', config=VALIDATION_CLIENT_CONFIG)
             await asyncio.get_event_loop().run_in_executor(
                 self.executor,
                 sts_client.get_caller_identity
@@ -468,7 +618,26 @@ class AWSSessionManager:
                 ) from e
             raise AWSSessionError(f"Failed to create SSO session for {profile.name}: {str(e)}") from e
     
-    async def _create_boto3_session_from_cached(self, session: AWSSession) -> boto3.Session:
+    def _get_boto3_session(self, session: AWSSession) -> boto3.Session:
+        """
+        Get the boto3 session for a cached session, creating it on first use
+        
+        Constructing a boto3 session loads botocore's data and credential chain,
+        so one instance is kept per cached session and reused by every request.
+        """
+        boto3_session = self._boto3_sessions.get(session.session_id)
+        if boto3_session is None:
+            # Drop sessions whose cache entries have expired or been evicted
+            for session_id in self._boto3_sessions.keys() - self.session_cache.sessions.keys():
+                del self._boto3_sessions[session_id]
+            for session_id in self._session_identities.keys() - self.session_cache.sessions.keys():
+                del self._session_identities[session_id]
+            
+            boto3_session = self._create_boto3_session_from_cached(session)
+            self._boto3_sessions[session.session_id] = boto3_session
+        return boto3_session
+    
+    def _create_boto3_session_from_cached(self, session: AWSSession) -> boto3.Session:
         """
         Create boto3 session from cached session
         
@@ -498,13 +667,12 @@ class AWSSessionManager:
             region_name=session.region
         )
     
-    async def _validate_session(self, session: boto3.Session) -> None:
-        """Validate that session credentials work"""
+    async def _validate_session(self, session: boto3.Session) -> Dict[str, Any]:
+        """Validate that session credentials work, returning the STS caller identity"""
         try:
-            sts_client = session.client('sts')
-            await asyncio.get_event_loop().run_in_executor(
+            return await asyncio.get_running_loop().run_in_executor(
                 self.executor,
-                sts_client.get_caller_identity
+                lambda: self.create_client(session, 'sts', config=VALIDATION_CLIENT_CONFIG).get_caller_identity()
             )
         except Exception as e:
             raise AWSSessionError(f"Session validation failed: {str(e)}") from e
@@ -512,23 +680,48 @@ class AWSSessionManager:
 
 # Global session manager instance
 _session_manager: Optional[AWSSessionManager] = None
+_session_manager_lock = threading.Lock()
 
 
-def get_session_manager() -> AWSSessionManager:
-    """Get global session manager instance"""
+def get_session_manager_instance() -> AWSSessionManager:
+    """Get global session manager instance from synchronous code"""
     global _session_manager
     if _session_manager is None:
-        _session_manager = AWSSessionManager()
+        # Double-checked so concurrent first calls build a single session manager
+        with _session_manager_lock:
+            if _session_manager is None:
+                _session_manager = AWSSessionManager()
     return _session_manager
 
 
+async def get_session_manager() -> AWSSessionManager:
+    """
+    Get global session manager instance
+    
+    Declared async so FastAPI resolves it on the event loop; sync dependencies
+    are run in the threadpool on every request.
+    """
+    return get_session_manager_instance()
+
+
 async def cleanup_sessions_periodically():
     """Background task to clean up expired sessions"""
     while True:
         try:
-            session_manager = get_session_manager()
+            session_manager = await get_session_manager()
             session_manager.cleanup_expired_sessions()
             await asyncio.sleep(300)  # Clean up every 5 minutes
         except Exception as e:
             logger.error(f"Error in session cleanup task: {str(e)}")
             await asyncio.sleep(60)  # Wait 1 minute before retrying
+
+
+async def prefetch_sessions_periodically():
+    """Background task to refresh sessions before they expire, off the request path"""
+    while True:
+        try:
+            session_manager = await get_session_manager()
+            await session_manager.prefetch_expiring_sessions()
+        except Exception as e:
+            logger.error(f"Error in session prefetch task: {str(e)}")
+        await asyncio.sleep(SESSION_PREFETCH_INTERVAL_SECONDS)
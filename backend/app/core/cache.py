@@ -0,0 +1,202 @@
+"""
+Shared response cache for Cloud Explorer API
+"""
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds to skip Redis after a connection or command failure
+REDIS_RETRY_DELAY_SECONDS = 30
+
+
+class ResponseCache:
+    """
+    Response cache shared across workers through Redis
+    
+    Entries are flat mappings of field name to bytes, stored as Redis hashes.
+    When Redis is disabled or unreachable, entries are kept in process memory
+    so caching keeps working for a single worker. The in-process store expires
+    entries like Redis does and holds at most max_local_entries, evicting the
+    least recently used.
+    
+    Eviction is left to the Redis server, which should be configured with
+    maxmemory-policy allkeys-lfu so frequently requested entries survive.
+    """
+    
+    def __init__(self, namespace: str = "cloud_explorer", max_local_entries: int = 64):
+        """
+        Initialize response cache
+        
+        Args:
+            namespace: Prefix for Redis keys
+            max_local_entries: Maximum entries kept in the in-process store
+        """
+        self.namespace = namespace
+        self.max_local_entries = max_local_entries
+        # Cache key -> (monotonic expiry time, entry), in least recently used order
+        self._local: "OrderedDict[str, Tuple[float, Dict[str, bytes]]]" = OrderedDict()
+        self._redis = None
+        self._redis_retry_at = 0.0
+    
+    def _get_redis(self):
+        """Get the Redis client, or None if Redis should not be used"""
+        if not settings.REDIS_CACHE_ENABLED or time.monotonic() < self._redis_retry_at:
+            return None
+        
+        if self._redis is None:
+            import redis.asyncio as redis
+            self._redis = redis.from_url(settings.REDIS_URL)
+        return self._redis
+    
+    def _redis_failed(self, error: Exception) -> None:
+        """Fall back to the in-process cache for a while after a Redis error"""
+        logger.warning(f"Redis cache unavailable, using in-process cache: {str(error)}")
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_DELAY_SECONDS
+    
+    async def get(self, key: str) -> Optional[Dict[str, bytes]]:
+        """
+        Get a cache entry
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Entry fields, or None if not cached
+        """
+        redis = self._get_redis()
+        if redis is not None:
+            try:
+                entry = await redis.hgetall(f"{self.namespace}:{key}")
+                return {field.decode(): value for field, value in entry.items()} or None
+            except Exception as e:
+                self._redis_failed(e)
+        
+        local_entry = self._local.get(key)
+        if local_entry is None:
+            return None
+        
+        expires_at, entry = local_entry
+        if time.monotonic() >= expires_at:
+            del self._local[key]
+            return None
+        
+        self._local.move_to_end(key)
+        return entry
+    
+    async def set(self, key: str, entry: Dict[str, bytes], ttl_seconds: int) -> None:
+        """
+        Store a cache entry
+        
+        Args:
+            key: Cache key
+            entry: Entry fields
+            ttl_seconds: Time until the entry is dropped
+        """
+        redis = self._get_redis()
+        if redis is not None:
+            try:
+                redis_key = f"{self.namespace}:{key}"
+                async with redis.pipeline(transaction=True) as pipe:
+                    pipe.delete(redis_key)
+                    pipe.hset(redis_key, mapping=entry)
+                    pipe.expire(redis_key, ttl_seconds)
+                    await pipe.execute()
+                return
+            except Exception as e:
+                self._redis_failed(e)
+        
+        self._local[key] = (time.monotonic() + ttl_seconds, entry)
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_local_entries:
+            self._local.popitem(last=False)
+    
+    async def clear(self, prefix: str) -> int:
+        """
+        Remove all entries whose key starts with a prefix
+        
+        Args:
+            prefix: Cache key prefix
+        
+        Returns:
+            Number of entries removed
+        """
+        local_keys = [key for key in self._local if key.startswith(prefix)]
+        for key in local_keys:
+            del self._local[key]
+        cleared = len(local_keys)
+        
+        redis = self._get_redis()
+        if redis is not None:
+            try:
+                redis_keys = [key async for key in redis.scan_iter(match=f"{self.namespace}:{prefix}*")]
+                if redis_keys:
+                    cleared += await redis.delete(*redis_keys)
+            except Exception as e:
+                self._redis_failed(e)
+        
+        return cleared
+
+
+# Global response cache instance
+response_cache = ResponseCache()
+
+
+def compute_etag(content: bytes) -> str:
+    """
+    Compute a strong HTTP ETag for a response body
+    
+    Args:
+        content: Response body
+    
+    Returns:
+        Quoted ETag value
+    """
+    return f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Check whether the client's If-None-Match header matches an ETag
+    
+    Args:
+        request: Incoming request
+        etag: Current quoted ETag of the resource
+    
+    Returns:
+        True if the client copy is current and a 304 can be returned
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    
+    # Weak comparison, as required for If-None-Match
+    client_etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in client_etags or etag.removeprefix("W/") in client_etags
+
+
+def cacheable_json_response(request: Request, content: bytes, etag: str, cache_control: str) -> Response:
+    """
+    Build a JSON response that HTTP caches can store and revalidate
+    
+    Args:
+        request: Incoming request
+        content: Serialized JSON body
+        etag: Quoted ETag of the body
+        cache_control: Cache-Control header value
+    
+    Returns:
+        304 Not Modified if the client copy is current, otherwise the JSON response
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
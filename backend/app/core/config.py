@@ -91,6 +91,7 @@ class Settings(BaseSettings):
     RATE_LIMITING_ENABLED: bool = Field(default=True, description="Enable rate limiting")
     RATE_LIMIT_REQUESTS: int = Field(default=100, ge=1, description="Rate limit requests per minute")
     RATE_LIMIT_WINDOW: int = Field(default=60, ge=1, description="Rate limit window in seconds")
+    RATE_LIMIT_REDIS_ENABLED: bool = Field(default=False, description="Share rate limit counters across workers via Redis")
     
     # API Rate Limits
     API_RATE_LIMIT_CONFIG: int = Field(default=10, ge=1, description="Config API rate limit per minute")
@@ -119,6 +120,7 @@ class Settings(BaseSettings):
     # =============================================================================
     
     REDIS_URL: str = Field(default="redis://localhost:6379/0", description="Redis connection URL")
+    REDIS_CACHE_ENABLED: bool = Field(default=False, description="Share API response caches across workers via Redis")
     CACHE_TTL_SECONDS: int = Field(default=300, ge=60, description="Default cache TTL in seconds")
     
     # Session Configuration
@@ -0,0 +1,19 @@
+"""
+Response classes for Cloud Explorer API
+"""
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered by pydantic-core's native encoder
+    
+    A drop-in replacement for JSONResponse, serializing with the Rust encoder
+    already used for API models instead of the stdlib json module.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
@@ -0,0 +1,23 @@
+"""
+Route classes for Cloud Explorer API
+"""
+from typing import Any, Awaitable, Callable
+
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+class DirectAPIRoute(APIRoute):
+    """
+    API route that passes the request straight to its endpoint
+
+    For endpoints that take only the request and return a ready Response,
+    such as precomputed static payloads. Dependency resolution, parameter
+    validation and response serialization are skipped, while the route keeps
+    its OpenAPI documentation and any decorators applied to the endpoint.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        endpoint: Any = self.endpoint
+        return endpoint
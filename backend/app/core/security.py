@@ -1,41 +1,197 @@
 """
 Security middleware for Cloud Explorer API
 """
+import asyncio
+import logging
+import math
 import time
-from typing import Callable, Optional
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from fastapi import HTTPException
+from starlette.datastructures import Headers
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.trustedhost import TrustedHostMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 
 from app.core.config import settings
+from app.core.cache import REDIS_RETRY_DELAY_SECONDS
 
+logger = logging.getLogger(__name__)
 
-# Rate limiter instance
+
+# Rate limiter instance. With Redis, counters are shared by all workers so limits
+# hold across processes; if Redis is unreachable, limits fall back to memory.
 limiter = Limiter(
     key_func=get_remote_address,
-    default_limits=[f"{settings.RATE_LIMIT_REQUESTS}/minute"] if settings.RATE_LIMITING_ENABLED else []
+    default_limits=[f"{settings.RATE_LIMIT_REQUESTS}/minute"] if settings.RATE_LIMITING_ENABLED else [],
+    storage_uri=settings.REDIS_URL if settings.RATE_LIMIT_REDIS_ENABLED else "memory://",
+    in_memory_fallback_enabled=settings.RATE_LIMIT_REDIS_ENABLED
+)
+
+
+# Atomically refills and spends from a token bucket stored as a Redis hash.
+# Uses the Redis server clock so all workers agree on elapsed time. Returns
+# "0" if allowed, otherwise the seconds until a token is available (as a
+# string, since Redis truncates Lua numbers to integers).
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'last')
+local tokens = tonumber(bucket[1]) or burst
+local last = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - last) * rate)
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'last', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate))
+return tostring(retry_after)
+"""
+
+# Redis client and registered bucket script, shared by all token bucket limiters
+_redis = None
+_token_bucket_script = None
+_redis_retry_at = 0.0
+
+
+def _get_token_bucket_script():
+    """Get the Redis token bucket script, or None if Redis should not be used"""
+    global _redis, _token_bucket_script
+    if not settings.RATE_LIMIT_REDIS_ENABLED or time.monotonic() < _redis_retry_at:
+        return None
+    
+    if _token_bucket_script is None:
+        import redis.asyncio as redis
+        _redis = redis.from_url(settings.REDIS_URL)
+        _token_bucket_script = _redis.register_script(TOKEN_BUCKET_SCRIPT)
+    return _token_bucket_script
+
+
+def _token_bucket_redis_failed(error: Exception) -> None:
+    """Fall back to in-process buckets for a while after a Redis error"""
+    global _redis_retry_at
+    logger.warning(f"Redis rate limiting unavailable, using in-process buckets: {str(error)}")
+    _redis_retry_at = time.monotonic() + REDIS_RETRY_DELAY_SECONDS
+
+
+class TokenBucketLimiter:
+    """
+    Token bucket rate limiter
+    
+    Each key has a bucket of up to `burst` tokens that refills continuously at
+    `rate` tokens per second, and every request spends one token. Unlike a
+    fixed window, no extra burst is allowed at window boundaries, and a bucket
+    is only its token count and last refill time.
+    
+    With RATE_LIMIT_REDIS_ENABLED, buckets live in Redis and are updated by a
+    Lua script, so all workers share one quota. When Redis is unreachable,
+    buckets are kept in process memory instead.
+    """
+    
+    def __init__(self, name: str, rate: float, burst: int, max_buckets: int = 10000):
+        """
+        Initialize token bucket limiter
+        
+        Args:
+            name: Limiter name, used in Redis keys
+            rate: Tokens added per second
+            burst: Bucket capacity
+            max_buckets: In-process bucket count above which full buckets are pruned
+        """
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self.max_buckets = max_buckets
+        # Key -> (tokens, monotonic time of last refill)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+    
+    async def acquire(self, key: str) -> float:
+        """
+        Spend a token from a bucket, in Redis when enabled
+        
+        Args:
+            key: Bucket key
+        
+        Returns:
+            0 if the request is allowed, otherwise seconds until a token is available
+        """
+        script = _get_token_bucket_script()
+        if script is not None:
+            try:
+                retry_after = await script(
+                    keys=[f"cloud_explorer:rl:{self.name}:{key}"],
+                    args=[self.rate, self.burst]
+                )
+                return float(retry_after)
+            except Exception as e:
+                _token_bucket_redis_failed(e)
+        
+        return self.hit(key)
+    
+    def hit(self, key: str) -> float:
+        """
+        Spend a token from an in-process bucket
+        
+        Args:
+            key: Bucket key
+        
+        Returns:
+            0 if the request is allowed, otherwise seconds until a token is available
+        """
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            tokens = float(self.burst)
+            if len(self._buckets) >= self.max_buckets:
+                self._prune(now)
+        else:
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            return (1 - tokens) / self.rate
+        
+        self._buckets[key] = (tokens - 1, now)
+        return 0.0
+    
+    def _prune(self, now: float) -> None:
+        """Drop buckets that have refilled completely, which behave like new ones"""
+        self._buckets = {
+            key: bucket for key, bucket in self._buckets.items()
+            if bucket[0] + (now - bucket[1]) * self.rate < self.burst
+        }
+
+
+# Cache headers added to responses that do not set their own Cache-Control
+NO_CACHE_HEADERS = (
+    (b"cache-control", b"no-cache, no-store, must-revalidate"),
+    (b"pragma", b"no-cache"),
+    (b"expires", b"0"),
 )
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """
     Middleware to add security headers to all responses
+    
+    A pure ASGI middleware: the headers are encoded once and spliced into each
+    response start message, replacing any headers of the same name.
     """
     
     def __init__(self, app: ASGIApp, enabled: bool = True):
-        super().__init__(app)
+        self.app = app
         self.enabled = enabled
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
-        
-        if not self.enabled:
-            return response
         
         # Security headers
         security_headers = {
@@ -61,24 +217,115 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             "Permissions-Policy": "geolocation=(), microphone=(), camera=()",
             
             # Remove server information
-            "Server": "Cloud Explorer API",
-            
-            # Cache control for API responses
-            "Cache-Control": "no-cache, no-store, must-revalidate",
-            "Pragma": "no-cache",
-            "Expires": "0"
+            "Server": "Cloud Explorer API"
         }
+        self.security_headers = tuple(
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in security_headers.items()
+        )
+        self.security_header_names = frozenset(name for name, _ in self.security_headers)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
         
-        # Apply security headers
-        for header_name, header_value in security_headers.items():
-            response.headers[header_name] = header_value
+        async def send_with_security_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [
+                    header for header in message.get("headers", ())
+                    if header[0].lower() not in self.security_header_names
+                ]
+                has_cache_control = any(name.lower() == b"cache-control" for name, _ in headers)
+                headers.extend(self.security_headers)
+                
+                # Cache control for API responses, unless the endpoint set its own policy
+                if not has_cache_control:
+                    headers.extend(NO_CACHE_HEADERS)
+                message["headers"] = headers
+            await send(message)
         
-        return response
+        await self.app(scope, receive, send_with_security_headers)
+
+
+class FastTrustedHostMiddleware(TrustedHostMiddleware):
+    """
+    Trusted host middleware with a set lookup for exactly listed hosts
+    
+    Requests for a host listed verbatim pass after one set membership test.
+    Wildcard patterns, www redirects, unusual Host headers and rejections
+    fall back to Starlette's scan of the allowed hosts.
+    """
+    
+    def __init__(self, app: ASGIApp, allowed_hosts: Optional[Sequence[str]] = None, www_redirect: bool = True):
+        super().__init__(app, allowed_hosts=allowed_hosts, www_redirect=www_redirect)
+        self.exact_hosts = frozenset(host for host in self.allowed_hosts if not host.startswith("*"))
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket"):
+            host = Headers(scope=scope).get("host", "").split(":", 1)[0]
+            if host in self.exact_hosts:
+                await self.app(scope, receive, send)
+                return
+        
+        await super().__call__(scope, receive, send)
+
+
+# Maximum security log entries waiting to be written; further entries are dropped
+REQUEST_LOG_QUEUE_SIZE = 10000
+
+
+def _format_request_log(entry: Tuple[str, str, str, int, float, str]) -> str:
+    """Format a queued security log entry"""
+    method, path, client_ip, status_code, process_time, user_agent = entry
+    return (f"Security Log: {method} {path} - "
+            f"IP: {client_ip} - Status: {status_code} - "
+            f"Time: {process_time:.3f}s - UA: {user_agent[:50]}")
+
+
+def _write_request_logs(entries: Sequence[Tuple[str, str, str, int, float, str]]) -> None:
+    """Write a batch of security log entries to stdout in one call"""
+    print("\n".join(_format_request_log(entry) for entry in entries), flush=True)
+
+
+def _take_queued_entries(
+    queue: "asyncio.Queue[Tuple[str, str, str, int, float, str]]"
+) -> List[Tuple[str, str, str, int, float, str]]:
+    """Remove and return every entry currently queued"""
+    entries = []
+    while not queue.empty():
+        entries.append(queue.get_nowait())
+    return entries
+
+
+async def drain_request_log(queue: "asyncio.Queue[Tuple[str, str, str, int, float, str]]") -> None:
+    """
+    Write queued security log entries until cancelled
+    
+    Entries queued since the last write are written as one batch from the
+    default executor, so a slow stdout never blocks the event loop.
+    
+    Args:
+        queue: Queue filled by RequestLoggingMiddleware
+    """
+    try:
+        while True:
+            entries = [await queue.get()]
+            entries.extend(_take_queued_entries(queue))
+            await asyncio.get_running_loop().run_in_executor(None, _write_request_logs, entries)
+    finally:
+        # Flush entries still queued at shutdown
+        entries = _take_queued_entries(queue)
+        if entries:
+            _write_request_logs(entries)
 
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """
     Middleware to log requests for security monitoring
+    
+    Entries are queued on app.state.request_log_queue when the application
+    has started one, and written by drain_request_log off the request path.
     """
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
@@ -96,9 +343,15 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         
         # Log request information (in production, this would go to a security log)
         if settings.is_development:
-            print(f"Security Log: {request.method} {request.url.path} - "
-                  f"IP: {client_ip} - Status: {response.status_code} - "
-                  f"Time: {process_time:.3f}s - UA: {user_agent[:50]}")
+            entry = (request.method, request.url.path, client_ip, response.status_code, process_time, user_agent)
+            log_queue = getattr(request.app.state, "request_log_queue", None)
+            if log_queue is None:
+                print(_format_request_log(entry))
+            else:
+                try:
+                    log_queue.put_nowait(entry)
+                except asyncio.QueueFull:
+                    pass
         
         # Add timing header
         response.headers["X-Process-Time"] = str(process_time)
@@ -147,10 +400,10 @@ def rate_limit_config():
     return lambda f: f
 
 
-def rate_limit_health():
-    """Rate limit decorator for health endpoints"""
+def rate_limit_exempt():
+    """Decorator exempting an endpoint from all rate limits, including the defaults"""
     if settings.RATE_LIMITING_ENABLED:
-        return limiter.limit(get_rate_limit_string(settings.API_RATE_LIMIT_HEALTH))
+        return limiter.exempt
     return lambda f: f
 
 
@@ -159,3 +412,50 @@ def rate_limit_default():
     if settings.RATE_LIMITING_ENABLED:
         return limiter.limit(get_rate_limit_string(settings.API_RATE_LIMIT_DEFAULT))
     return lambda f: f
+
+
+def token_bucket(requests_per_minute: int):
+    """
+    Rate limit decorator using a token bucket per client for the decorated route
+    
+    Buckets are shared across workers through Redis when RATE_LIMIT_REDIS_ENABLED
+    is set. The route is exempted from slowapi's default limits. The endpoint must
+    take a `request: Request` parameter.
+    
+    Args:
+        requests_per_minute: Sustained rate, also used as the burst size
+    """
+    if not settings.RATE_LIMITING_ENABLED:
+        return lambda f: f
+    
+    def decorator(func: Callable) -> Callable:
+        bucket = TokenBucketLimiter(
+            name=func.__name__,
+            rate=requests_per_minute / 60,
+            burst=requests_per_minute
+        )
+        
+        @wraps(func)
+        async def wrapper(*args, request: Request, **kwargs):
+            retry_after = await bucket.acquire(get_remote_address(request))
+            if retry_after:
+                raise HTTPException(
+                    status_code=429,
+                    detail=f"Rate limit exceeded: {requests_per_minute} per 1 minute",
+                    headers={"Retry-After": str(math.ceil(retry_after))}
+                )
+            return await func(*args, request=request, **kwargs)
+        
+        return limiter.exempt(wrapper)
+    
+    return decorator
+
+
+def rate_limit_sessions():
+    """Rate limit decorator for AWS session endpoints"""
+    return token_bucket(settings.API_RATE_LIMIT_DEFAULT)
+
+
+def rate_limit_health():
+    """Rate limit decorator for health endpoints"""
+    return token_bucket(settings.API_RATE_LIMIT_HEALTH)
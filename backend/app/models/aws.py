@@ -172,6 +172,11 @@ class AWSSessionExpiredError(AWSSessionError):
     pass
 
 
+class AWSRoleAssumptionError(AWSSessionError):
+    """Raised when a requested role cannot be assumed"""
+    pass
+
+
 class AWSSession(BaseModel):
     """
     AWS session information with caching and expiration
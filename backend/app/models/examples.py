@@ -0,0 +1,118 @@
+"""
+OpenAPI schema examples for API response models
+
+Imported lazily by app.models.responses only when API documentation is
+enabled, so production processes never hold these payloads in memory.
+"""
+from typing import Any, Dict
+
+
+RESPONSE_EXAMPLES: Dict[str, Dict[str, Any]] = {
+    "ProfileValidationInfo": {
+        "is_valid": True,
+        "status": "valid",
+        "account_id": "123456789012",
+        "user_arn": "arn:aws:sts::123456789012:assumed-role/MyRole/session",
+        "user_id": "AROABC123DEFGHIJKLMN:session",
+        "last_validated": "2025-08-20T10:30:00Z",
+        "error": None
+    },
+    "AccountProfileSummary": {
+        "profile_name": "production",
+        "profile_type": "iam_role",
+        "is_default": False,
+        "is_valid": True,
+        "status": "valid",
+        "account_id": "123456789012"
+    },
+    "AccountProfile": {
+        "profile_name": "production",
+        "profile_type": "iam_role",
+        "region": "us-east-1",
+        "output": "json",
+        "validation": {
+            "is_valid": True,
+            "status": "valid",
+            "account_id": "123456789012",
+            "user_arn": "arn:aws:sts::123456789012:assumed-role/ProductionRole/session",
+            "last_validated": "2025-08-20T10:30:00Z"
+        },
+        "role_arn": "arn:aws:iam::123456789012:role/ProductionRole",
+        "source_profile": "default",
+        "is_default": False,
+        "available_regions": ["us-east-1", "us-west-2", "eu-west-1"],
+        "permissions_summary": {
+            "services": ["ec2", "s3", "rds"],
+            "admin_access": False,
+            "read_only": False
+        }
+    },
+    "AccountsResponse": {
+        "profiles": [
+            {
+                "profile_name": "default",
+                "profile_type": "iam_user",
+                "is_default": True,
+                "is_valid": True,
+                "status": "valid",
+                "account_id": "123456789012"
+            }
+        ],
+        "total_profiles": 3,
+        "valid_profiles": 2,
+        "invalid_profiles": 1,
+        "default_profile": "default",
+        "cache_info": {
+            "cached": True,
+            "cache_age_seconds": 120,
+            "expires_in_seconds": 780
+        },
+        "generated_at": "2025-08-20T10:30:00Z"
+    },
+    "ErrorResponse": {
+        "error": "Resource not found",
+        "detail": "The requested AWS profile does not exist",
+        "timestamp": "2025-08-20T10:30:00Z"
+    },
+    "SuccessResponse": {
+        "message": "Operation completed successfully",
+        "data": {"id": "12345", "status": "active"},
+        "timestamp": "2025-08-20T10:30:00Z"
+    },
+    "RootResponse": {
+        "message": "Cloud Explorer API",
+        "version": "1.0.0",
+        "description": "Multi-account AWS resource explorer and management tool",
+        "environment": "development",
+        "docs": "/docs",
+        "health": "/api/health",
+        "enabled_services": ["ec2", "rds", "s3", "lambda", "vpc"]
+    },
+    "ConfigResponse": {
+        "project_name": "Cloud Explorer API",
+        "version": "1.0.0",
+        "debug": True,
+        "environment": "development",
+        "aws_region": "us-east-1",
+        "enabled_services": ["ec2", "rds", "s3", "lambda", "vpc"],
+        "cors_origins": ["http://localhost:3000"],
+        "log_level": "DEBUG"
+    },
+    "DetailedHealthResponse": {
+        "status": "healthy",
+        "timestamp": "2025-08-20T10:30:00Z",
+        "version": "1.0.0",
+        "environment": "development",
+        "api": {
+            "name": "Cloud Explorer API",
+            "version": "1.0.0",
+            "docs_url": "/docs",
+            "redoc_url": "/redoc"
+        },
+        "configuration": {
+            "debug": True,
+            "aws_default_region": "us-east-1",
+            "cors_origins": ["http://localhost:3000"]
+        }
+    },
+}
@@ -1,12 +1,29 @@
 """
 API Response Models for Cloud Explorer
 """
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field
+from typing import Annotated, Any, Literal, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from typing_extensions import NotRequired, TypedDict
 from enum import Enum
 
 from app.models.aws import AWSProfileType
+from app.core.config import settings
+
+
+def _schema_example(model_name: str) -> Optional[dict[str, Any]]:
+    """
+    Get the OpenAPI example for a response model
+    
+    Examples are only loaded when API documentation is enabled, keeping
+    them out of memory in production deployments.
+    """
+    if not settings.ENABLE_OPENAPI_DOCS:
+        return None
+    
+    from app.models.examples import RESPONSE_EXAMPLES
+    return {"example": RESPONSE_EXAMPLES[model_name]}
 
 
 class AccountStatus(str, Enum):
@@ -17,119 +34,160 @@ class AccountStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
-class ProfileValidationInfo(BaseModel):
-    """Profile validation information"""
+class CacheInfo(TypedDict):
+    """Response cache information"""
+    cached: bool
+    cache_age_seconds: int
+    expires_in_seconds: int
+    stale: NotRequired[bool]
+
+
+class PermissionsSummary(TypedDict, total=False):
+    """High-level permissions summary for a profile"""
+    services: list[str]
+    admin_access: bool
+    read_only: bool
+    service_count: int
+    error: str
+
+
+class ApiInfo(TypedDict, total=False):
+    """API information for detailed health checks"""
+    name: str
+    version: str
+    docs_url: str
+    redoc_url: str
+
+
+class ConfigurationSummary(TypedDict, total=False):
+    """Configuration summary for detailed health checks"""
+    debug: bool
+    aws_default_region: str
+    cors_origins: list[str]
+
+
+@dataclass(frozen=True)
+class ProfileValidationInfo:
+    """
+    Profile validation information
+    
+    A plain dataclass rather than a model: instances are built internally
+    from already-typed values, so construction skips validation. Pydantic
+    still derives the schema and serializer when it is nested in models.
+    """
+    __pydantic_config__ = ConfigDict(
+        defer_build=True,
+        json_schema_extra=_schema_example("ProfileValidationInfo")
+    )
+    
+    is_valid: Annotated[bool, Field(description="Whether the profile credentials are valid")]
+    status: Annotated[AccountStatus, Field(description="Account validation status")]
+    account_id: Annotated[Optional[str], Field(description="AWS account ID")] = None
+    user_arn: Annotated[Optional[str], Field(description="User or role ARN")] = None
+    user_id: Annotated[Optional[str], Field(description="User ID")] = None
+    last_validated: Annotated[Optional[datetime], Field(description="Last validation timestamp")] = None
+    error: Annotated[Optional[str], Field(description="Validation error message if any")] = None
+
+
+class AccountProfileSummary(BaseModel):
+    """Compact AWS account profile information for list views"""
+    profile_name: str = Field(..., description="AWS profile name")
+    profile_type: AWSProfileType = Field(..., description="Type of AWS profile")
+    is_default: bool = Field(False, description="Whether this is the default profile")
     is_valid: bool = Field(..., description="Whether the profile credentials are valid")
     status: AccountStatus = Field(..., description="Account validation status")
     account_id: Optional[str] = Field(None, description="AWS account ID")
-    user_arn: Optional[str] = Field(None, description="User or role ARN")
-    user_id: Optional[str] = Field(None, description="User ID")
-    last_validated: Optional[datetime] = Field(None, description="Last validation timestamp")
-    error: Optional[str] = Field(None, description="Validation error message if any")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "is_valid": True,
-                "status": "valid",
-                "account_id": "123456789012",
-                "user_arn": "arn:aws:sts::123456789012:assumed-role/MyRole/session",
-                "user_id": "AROABC123DEFGHIJKLMN:session",
-                "last_validated": "2025-08-20T10:30:00Z",
-                "error": None
-            }
-        }
-
-
-class AccountProfile(BaseModel):
-    """AWS account profile information"""
+        defer_build = True
+        frozen = True
+        json_schema_extra = _schema_example("AccountProfileSummary")
+
+
+class _AccountProfileBase(BaseModel):
+    """Fields shared by every AWS account profile type"""
     profile_name: str = Field(..., description="AWS profile name")
     profile_type: AWSProfileType = Field(..., description="Type of AWS profile")
     region: Optional[str] = Field(None, description="Default region for this profile")
     output: Optional[str] = Field(None, description="Default output format")
     validation: ProfileValidationInfo = Field(..., description="Profile validation information")
     
-    # Role-specific information
+    # Additional metadata
+    is_default: bool = Field(False, description="Whether this is the default profile")
+    available_regions: tuple[str, ...] = Field((), description="Available regions for this profile")
+    permissions_summary: Optional[PermissionsSummary] = Field(None, description="High-level permissions summary")
+    
+    # Serialized JSON, memoized since profiles are reused for the cache window
+    _json: Optional[bytes] = PrivateAttr(None)
+    
+    class Config:
+        defer_build = True
+        frozen = True
+        json_schema_extra = _schema_example("AccountProfile")
+    
+    def to_json(self) -> bytes:
+        """Serialize profile to JSON, omitting unset optional (None) fields"""
+        if self._json is None:
+            self._json = self.model_dump_json(by_alias=True, exclude_none=True).encode()
+        return self._json
+    
+    def to_summary(self) -> AccountProfileSummary:
+        """Get the compact list-view representation of this profile"""
+        return AccountProfileSummary.model_construct(
+            profile_name=self.profile_name,
+            profile_type=self.profile_type,
+            is_default=self.is_default,
+            is_valid=self.validation.is_valid,
+            status=self.validation.status,
+            account_id=self.validation.account_id
+        )
+
+
+class CredentialsAccountProfile(_AccountProfileBase):
+    """AWS account profile backed by static, session or web identity credentials"""
+    profile_type: Literal[
+        AWSProfileType.IAM_USER, AWSProfileType.SESSION, AWSProfileType.FEDERATED
+    ] = Field(..., description="Type of AWS profile")
+
+
+class RoleAccountProfile(_AccountProfileBase):
+    """AWS account profile that assumes an IAM role"""
+    profile_type: Literal[AWSProfileType.IAM_ROLE] = Field(..., description="Type of AWS profile")
     role_arn: Optional[str] = Field(None, description="IAM role ARN (for role profiles)")
     source_profile: Optional[str] = Field(None, description="Source profile for role assumption")
-    
-    # SSO-specific information
+
+
+class SSOAccountProfile(_AccountProfileBase):
+    """AWS account profile authenticated through IAM Identity Center (SSO)"""
+    profile_type: Literal[AWSProfileType.SSO] = Field(..., description="Type of AWS profile")
     sso_start_url: Optional[str] = Field(None, description="SSO start URL")
     sso_region: Optional[str] = Field(None, description="SSO region")
     sso_account_id: Optional[str] = Field(None, description="SSO account ID")
     sso_role_name: Optional[str] = Field(None, description="SSO role name")
     sso_session: Optional[str] = Field(None, description="SSO session name")
-    
-    # Additional metadata
-    is_default: bool = Field(False, description="Whether this is the default profile")
-    available_regions: List[str] = Field(default_factory=list, description="Available regions for this profile")
-    permissions_summary: Optional[Dict[str, Any]] = Field(None, description="High-level permissions summary")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "profile_name": "production",
-                "profile_type": "IAM_ROLE",
-                "region": "us-east-1",
-                "output": "json",
-                "validation": {
-                    "is_valid": True,
-                    "status": "valid",
-                    "account_id": "123456789012",
-                    "user_arn": "arn:aws:sts::123456789012:assumed-role/ProductionRole/session",
-                    "last_validated": "2025-08-20T10:30:00Z"
-                },
-                "role_arn": "arn:aws:iam::123456789012:role/ProductionRole",
-                "source_profile": "default",
-                "is_default": False,
-                "available_regions": ["us-east-1", "us-west-2", "eu-west-1"],
-                "permissions_summary": {
-                    "services": ["ec2", "s3", "rds"],
-                    "admin_access": False,
-                    "read_only": False
-                }
-            }
-        }
+
+
+# AWS account profile information, specialized on profile_type
+AccountProfile = Annotated[
+    Union[CredentialsAccountProfile, RoleAccountProfile, SSOAccountProfile],
+    Field(discriminator="profile_type")
+]
 
 
 class AccountsResponse(BaseModel):
     """Response model for accounts API endpoint"""
-    profiles: List[AccountProfile] = Field(..., description="List of AWS profiles with metadata")
+    profiles: list[AccountProfileSummary] = Field(..., description="List of AWS profile summaries")
     total_profiles: int = Field(..., description="Total number of profiles")
     valid_profiles: int = Field(..., description="Number of profiles with valid credentials")
     invalid_profiles: int = Field(..., description="Number of profiles with invalid credentials")
     default_profile: Optional[str] = Field(None, description="Name of the default profile")
-    cache_info: Dict[str, Any] = Field(..., description="Response cache information")
+    cache_info: CacheInfo = Field(..., description="Response cache information")
     generated_at: datetime = Field(default_factory=datetime.utcnow, description="Response generation timestamp")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "profiles": [
-                    {
-                        "profile_name": "default",
-                        "profile_type": "IAM_USER",
-                        "region": "us-east-1",
-                        "validation": {
-                            "is_valid": True,
-                            "status": "valid",
-                            "account_id": "123456789012"
-                        },
-                        "is_default": True
-                    }
-                ],
-                "total_profiles": 3,
-                "valid_profiles": 2,
-                "invalid_profiles": 1,
-                "default_profile": "default",
-                "cache_info": {
-                    "cached": True,
-                    "cache_age_seconds": 120,
-                    "expires_in_seconds": 780
-                },
-                "generated_at": "2025-08-20T10:30:00Z"
-            }
-        }
+        defer_build = True
+        frozen = True
+        json_schema_extra = _schema_example("AccountsResponse")
 
 
 class ErrorResponse(BaseModel):
@@ -139,29 +197,17 @@ class ErrorResponse(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Error timestamp")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "error": "Resource not found",
-                "detail": "The requested AWS profile does not exist",
-                "timestamp": "2025-08-20T10:30:00Z"
-            }
-        }
+        json_schema_extra = _schema_example("ErrorResponse")
 
 
 class SuccessResponse(BaseModel):
     """Standard success response model"""
     message: str = Field(..., description="Success message")
-    data: Optional[Dict[str, Any]] = Field(None, description="Response data")
+    data: Optional[dict[str, Any]] = Field(None, description="Response data")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Response timestamp")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "message": "Operation completed successfully",
-                "data": {"id": "12345", "status": "active"},
-                "timestamp": "2025-08-20T10:30:00Z"
-            }
-        }
+        json_schema_extra = _schema_example("SuccessResponse")
 
 
 class RootResponse(BaseModel):
@@ -172,20 +218,10 @@ class RootResponse(BaseModel):
     environment: str = Field(..., description="Current environment")
     docs: Optional[str] = Field(None, description="Documentation URL")
     health: str = Field(..., description="Health check endpoint")
-    enabled_services: List[str] = Field(..., description="List of enabled AWS services")
+    enabled_services: tuple[str, ...] = Field(..., description="List of enabled AWS services")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "message": "Cloud Explorer API",
-                "version": "1.0.0",
-                "description": "Multi-account AWS resource explorer and management tool",
-                "environment": "development",
-                "docs": "/docs",
-                "health": "/api/health",
-                "enabled_services": ["ec2", "rds", "s3", "lambda", "vpc"]
-            }
-        }
+        json_schema_extra = _schema_example("RootResponse")
 
 
 class ConfigResponse(BaseModel):
@@ -195,23 +231,12 @@ class ConfigResponse(BaseModel):
     debug: bool = Field(..., description="Debug mode status")
     environment: str = Field(..., description="Current environment")
     aws_region: str = Field(..., description="Default AWS region")
-    enabled_services: List[str] = Field(..., description="Enabled AWS services")
-    cors_origins: List[str] = Field(..., description="Allowed CORS origins")
+    enabled_services: tuple[str, ...] = Field(..., description="Enabled AWS services")
+    cors_origins: tuple[str, ...] = Field(..., description="Allowed CORS origins")
     log_level: str = Field(..., description="Current log level")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "project_name": "Cloud Explorer API",
-                "version": "1.0.0",
-                "debug": True,
-                "environment": "development",
-                "aws_region": "us-east-1",
-                "enabled_services": ["ec2", "rds", "s3", "lambda", "vpc"],
-                "cors_origins": ["http://localhost:3000"],
-                "log_level": "DEBUG"
-            }
-        }
+        json_schema_extra = _schema_example("ConfigResponse")
 
 
 class DetailedHealthResponse(BaseModel):
@@ -220,26 +245,8 @@ class DetailedHealthResponse(BaseModel):
     timestamp: str = Field(..., description="Check timestamp")
     version: str = Field(..., description="API version")
     environment: str = Field(..., description="Current environment")
-    api: Dict[str, Any] = Field(..., description="API information")
-    configuration: Dict[str, Any] = Field(..., description="Configuration details")
+    api: ApiInfo = Field(..., description="API information")
+    configuration: ConfigurationSummary = Field(..., description="Configuration details")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "status": "healthy",
-                "timestamp": "2025-08-20T10:30:00Z",
-                "version": "1.0.0",
-                "environment": "development",
-                "api": {
-                    "name": "Cloud Explorer API",
-                    "version": "1.0.0",
-                    "docs_url": "/docs",
-                    "redoc_url": "/redoc"
-                },
-                "configuration": {
-                    "debug": True,
-                    "aws_default_region": "us-east-1",
-                    "cors_origins": ["http://localhost:3000"]
-                }
-            }
-        }
+        json_schema_extra = _schema_example("DetailedHealthResponse")
@@ -3,12 +3,19 @@ AWS Accounts API endpoint
 """
 import logging
 import asyncio
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List, Tuple
 from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+from pydantic_core import from_json, to_json
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 
 from app.aws.session_manager import get_session_manager, AWSSessionManager
 from app.aws.client_factory import get_client_factory, AWSServiceClientFactory
@@ -16,11 +23,13 @@ from app.models.aws import AWSSessionError, AWSProfileNotFoundError, AWSProfile,
 from app.models.responses import (
     AccountsResponse, 
     AccountProfile, 
+    AccountProfileSummary,
     ProfileValidationInfo, 
     AccountStatus,
     ErrorResponse
 )
 from app.core.security import rate_limit_default
+from app.core.cache import response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -33,30 +42,114 @@ router = APIRouter(
     }
 )
 
-# Cache for accounts response (15-minute cache as specified)
-_accounts_cache: Dict[str, Any] = {}
-CACHE_DURATION_SECONDS = 900  # 15 minutes
+# Cache for accounts response, shared across workers. Each entry's duration scales
+# with how long it took to generate, so expensive responses are cached longer.
+CACHE_MIN_DURATION_SECONDS = 60
+CACHE_MAX_DURATION_SECONDS = 3600  # 1 hour
+CACHE_DURATION_PER_GENERATION_SECOND = 10
+
+# Identifies this process's monotonic clock; cache entries generated by other
+# workers (shared through Redis) fall back to wall-clock age
+_CLOCK_ID = uuid.uuid4().hex.encode()
+
+# In-progress background refreshes of stale cache entries, keyed by cache key
+_refresh_tasks: Dict[str, asyncio.Task] = {}
+
+# In-progress accounts generations shared by concurrent callers, keyed by cache key
+_inflight_generations: Dict[str, asyncio.Task] = {}
+
+# Serializer for the profile summary list, built once and reused across requests
+_PROFILES_ADAPTER = TypeAdapter(List[AccountProfileSummary])
+
+# Validator selecting the AccountProfile variant from profile_type
+_ACCOUNT_PROFILE_ADAPTER = TypeAdapter(AccountProfile)
+
+# Fallback regions shared by profiles whose regions could not be determined
+_COMMON_REGIONS: Tuple[str, ...] = ('us-east-1', 'us-west-2', 'eu-west-1')
+
+# Validation info shared by all profiles built without contacting AWS
+_SKIPPED_VALIDATION = ProfileValidationInfo(
+    is_valid=True,
+    status=AccountStatus.UNKNOWN,
+    account_id=None,
+    user_arn=None,
+    user_id=None,
+    last_validated=None,
+    error="Validation skipped"
+)
+
+# Profiles validated against AWS at once, keeping STS calls under rate limits
+MAX_CONCURRENT_PROFILE_VALIDATIONS = 20
+
+# Permission probes fail fast: one attempt with tight connect and read timeouts
+PERMISSION_PROBE_CONFIG = Config(
+    connect_timeout=2,
+    read_timeout=3,
+    retries={'max_attempts': 1}
+)
+
+# Backstop for a single AWS call (validation or probe), past the botocore timeouts
+AWS_CALL_TIMEOUT_SECONDS = 5
+
+# Available regions shared by all profiles, refreshed daily
+REGIONS_CACHE_SECONDS = 24 * 60 * 60
+_regions_cache: Optional[Tuple[float, Tuple[str, ...]]] = None
+
+# Per-profile validation results, shared by all accounts query variants
+VALIDATION_CACHE_SECONDS = 60
+_validation_cache: Dict[str, Tuple[float, ProfileValidationInfo]] = {}
 
 
 async def _get_profile_validation(
     profile_name: str, 
-    session_manager: AWSSessionManager,
-    client_factory: AWSServiceClientFactory
+    session_manager: AWSSessionManager
 ) -> ProfileValidationInfo:
     """
     Get validation information for a specific profile
     
+    Results are cached per profile for VALIDATION_CACHE_SECONDS, so adding a
+    profile or changing query options does not re-validate every profile.
+    
+    Args:
+        profile_name: AWS profile name
+        session_manager: Session manager instance
+        
+    Returns:
+        ProfileValidationInfo with validation details
+    """
+    cached = _validation_cache.get(profile_name)
+    if cached and time.monotonic() - cached[0] < VALIDATION_CACHE_SECONDS:
+        return cached[1]
+    
+    validation_info = await _validate_profile(profile_name, session_manager)
+    
+    # Unexpected errors may be transient, so only definitive results are cached
+    if validation_info.status != AccountStatus.UNKNOWN:
+        _validation_cache[profile_name] = (time.monotonic(), validation_info)
+    
+    return validation_info
+
+
+async def _validate_profile(
+    profile_name: str,
+    session_manager: AWSSessionManager
+) -> ProfileValidationInfo:
+    """
+    Validate a profile's credentials against AWS
+    
     Args:
         profile_name: AWS profile name
         session_manager: Session manager instance
-        client_factory: Client factory instance
         
     Returns:
         ProfileValidationInfo with validation details
     """
     try:
         # Validate credentials using session manager
-        validation_result = await session_manager.validate_credentials(profile_name)
+        validation_result = await asyncio.wait_for(
+            session_manager.validate_credentials(profile_name),
+            timeout=AWS_CALL_TIMEOUT_SECONDS
+        )
         
         if validation_result['valid']:
             return ProfileValidationInfo(
@@ -65,7 +158,7 @@ async def _get_profile_validation(
                 account_id=validation_result.get('account'),
                 user_arn=validation_result.get('arn'),
                 user_id=validation_result.get('user_id'),
-                last_validated=datetime.utcnow(),
+                last_validated=datetime.now(timezone.utc),
                 error=None
             )
         else:
@@ -75,7 +168,7 @@ async def _get_profile_validation(
                 account_id=None,
                 user_arn=None,
                 user_id=None,
-                last_validated=datetime.utcnow(),
+                last_validated=datetime.now(timezone.utc),
                 error=validation_result.get('error', 'Unknown validation error')
             )
             
@@ -86,9 +179,20 @@ async def _get_profile_validation(
             account_id=None,
             user_arn=None,
             user_id=None,
-            last_validated=datetime.utcnow(),
+            last_validated=datetime.now(timezone.utc),
             error=f"Profile not found: {str(e)}"
         )
+    except asyncio.TimeoutError:
+        logger.warning(f"Validation timed out for profile {profile_name}")
+        return ProfileValidationInfo(
+            is_valid=False,
+            status=AccountStatus.UNKNOWN,
+            account_id=None,
+            user_arn=None,
+            user_id=None,
+            last_validated=datetime.now(timezone.utc),
+            error=f"Validation timed out after {AWS_CALL_TIMEOUT_SECONDS} seconds"
+        )
     except Exception as e:
         logger.error(f"Error validating profile {profile_name}: {str(e)}")
         return ProfileValidationInfo(
@@ -97,32 +201,40 @@ async def _get_profile_validation(
             account_id=None,
             user_arn=None,
             user_id=None,
-            last_validated=datetime.utcnow(),
+            last_validated=datetime.now(timezone.utc),
             error=f"Validation error: {str(e)}"
         )
 
 
-async def _get_available_regions(
-    profile_name: str,
-    client_factory: AWSServiceClientFactory
-) -> List[str]:
+async def _get_available_regions(client_factory: AWSServiceClientFactory) -> Tuple[str, ...]:
     """
-    Get available regions for a profile
+    Get available regions, shared by all profiles
+    
+    The region list is the same for every profile and rarely changes, so it
+    is looked up once and reused for REGIONS_CACHE_SECONDS.
     
     Args:
-        profile_name: AWS profile name
         client_factory: Client factory instance
         
     Returns:
-        List of available regions
+        Available regions
     """
+    global _regions_cache
+    
+    now = time.monotonic()
+    if _regions_cache is not None and now - _regions_cache[0] < REGIONS_CACHE_SECONDS:
+        return _regions_cache[1]
+    
     try:
         # Get all regions using EC2 (available in all regions)
         regions = await client_factory.get_all_regions()
-        return regions[:10]  # Return first 10 regions to avoid overwhelming response
+        available_regions = tuple(regions[:10])  # Return first 10 regions to avoid overwhelming response
     except Exception as e:
-        logger.warning(f"Could not get regions for profile {profile_name}: {str(e)}")
-        return ['us-east-1', 'us-west-2', 'eu-west-1']  # Fallback regions
+        logger.warning(f"Could not get available regions: {str(e)}")
+        return _COMMON_REGIONS  # Fallback regions, retried on the next call
+    
+    _regions_cache = (now, available_regions)
+    return available_regions
 
 
 async def _get_permissions_summary(
@@ -145,39 +257,34 @@ async def _get_permissions_summary(
         return None
         
     try:
-        # Test basic service access
-        accessible_services = []
+        # Create all probe clients from one session
+        clients = await client_factory.get_clients(
+            ['s3', 'ec2', 'iam'], profile_name, 'us-east-1', config=PERMISSION_PROBE_CONFIG
+        )
         
-        # Test S3 access
-        try:
-            s3_client = await client_factory.get_client('s3', profile_name, 'us-east-1')
-            await asyncio.get_event_loop().run_in_executor(
-                None, s3_client.list_buckets
-            )
-            accessible_services.append('s3')
-        except:
-            pass
+        async def probe(service_name: str, operation: str, **kwargs) -> bool:
+            # A failed or hung probe means the service is not accessible
+            try:
+                await asyncio.wait_for(
+                    client_factory.call(clients[service_name], operation, **kwargs),
+                    timeout=AWS_CALL_TIMEOUT_SECONDS
+                )
+                return True
+            except (ClientError, BotoCoreError, asyncio.TimeoutError) as e:
+                logger.debug(f"Permission probe {service_name}:{operation} failed for profile {profile_name}: {str(e)}")
+                return False
         
-        # Test EC2 access
-        try:
-            ec2_client = await client_factory.get_client('ec2', profile_name, 'us-east-1')
-            await asyncio.get_event_loop().run_in_executor(
-                None, lambda: ec2_client.describe_regions(MaxResults=1)
-            )
-            accessible_services.append('ec2')
-        except:
-            pass
+        # Test S3, EC2 and IAM (admin-like permissions) access concurrently
+        s3_access, ec2_access, admin_access = await asyncio.gather(
+            probe('s3', 'list_buckets'),
+            probe('ec2', 'describe_regions'),
+            probe('iam', 'get_account_summary')
+        )
         
-        # Test IAM access (admin-like permissions)
-        admin_access = False
-        try:
-            iam_client = await client_factory.get_client('iam', profile_name, 'us-east-1')
-            await asyncio.get_event_loop().run_in_executor(
-                None, iam_client.get_account_summary
-            )
-            admin_access = True
-        except:
-            pass
+        accessible_services = [
+            service_name for service_name, accessible in (('s3', s3_access), ('ec2', ec2_access))
+            if accessible
+        ]
         
         return {
             "services": accessible_services,
@@ -201,7 +308,8 @@ async def _build_account_profile(
     aws_profile: AWSProfile,
     session_manager: AWSSessionManager,
     client_factory: AWSServiceClientFactory,
-    is_default: bool = False
+    is_default: bool = False,
+    include_permissions: bool = True
 ) -> AccountProfile:
     """
     Build comprehensive account profile information
@@ -211,26 +319,24 @@ async def _build_account_profile(
         session_manager: Session manager instance
         client_factory: Client factory instance
         is_default: Whether this is the default profile
+        include_permissions: Whether to include permissions summary
         
     Returns:
         AccountProfile with complete information
     """
-    # Get validation information
-    validation_info = await _get_profile_validation(
-        aws_profile.name, session_manager, client_factory
+    # Validation and regions are independent, so fetch them concurrently;
+    # regions come from the shared cache after the first lookup
+    validation_info, available_regions = await asyncio.gather(
+        _get_profile_validation(aws_profile.name, session_manager),
+        _get_available_regions(client_factory)
     )
     
-    # Get available regions
-    available_regions = await _get_available_regions(
-        aws_profile.name, client_factory
-    )
-    
-    # Get permissions summary
+    # Permissions can only be probed with valid credentials
     permissions_summary = await _get_permissions_summary(
         aws_profile.name, validation_info, client_factory
-    )
+    ) if include_permissions and validation_info.is_valid else None
     
-    return AccountProfile(
+    return _ACCOUNT_PROFILE_ADAPTER.validate_python(dict(
         profile_name=aws_profile.name,
         profile_type=aws_profile.profile_type,
         region=aws_profile.region,
@@ -246,12 +352,307 @@ async def _build_account_profile(
         is_default=is_default,
         available_regions=available_regions,
         permissions_summary=permissions_summary
+    ))
+
+
+def _build_unvalidated_profile(aws_profile: AWSProfile, is_default: bool = False) -> AccountProfile:
+    """
+    Build account profile information without contacting AWS
+    
+    Args:
+        aws_profile: AWS profile data
+        is_default: Whether this is the default profile
+        
+    Returns:
+        AccountProfile with validation marked as skipped
+    """
+    return _ACCOUNT_PROFILE_ADAPTER.validate_python(dict(
+        profile_name=aws_profile.name,
+        profile_type=aws_profile.profile_type,
+        region=aws_profile.region,
+        output=aws_profile.output,
+        validation=_SKIPPED_VALIDATION,
+        role_arn=aws_profile.role_arn,
+        source_profile=aws_profile.source_profile,
+        sso_start_url=aws_profile.sso_start_url,
+        sso_region=aws_profile.sso_region,
+        sso_account_id=aws_profile.sso_account_id,
+        sso_role_name=aws_profile.sso_role_name,
+        sso_session=aws_profile.sso_session,
+        is_default=is_default,
+        available_regions=_COMMON_REGIONS,
+        permissions_summary=None
+    ))
+
+
+async def _generate_accounts_entry(
+    include_invalid: bool,
+    validate_credentials: bool,
+    include_permissions: bool,
+    session_manager: AWSSessionManager,
+    client_factory: AWSServiceClientFactory
+) -> Dict[str, bytes]:
+    """
+    Build profiles and serialize the accounts response for caching
+    
+    The serialized body is split around cache_info so cached bytes can be
+    served with up-to-date cache information without re-serializing.
+    
+    Args:
+        include_invalid: Whether to include profiles with invalid credentials
+        validate_credentials: Whether to validate credentials
+        include_permissions: Whether to include permissions summary
+        session_manager: Session manager instance
+        client_factory: Client factory instance
+        
+    Returns:
+        Cache entry with serialized body parts, full profiles (as profile:<name>
+        fields), file fingerprint, generation timestamps and cache duration
+    """
+    started_at = time.monotonic()
+    
+    # Capture the file fingerprint before reading so concurrent edits invalidate the entry
+    credentials_reader = session_manager.credentials_reader
+    files_fingerprint = credentials_reader.get_files_fingerprint()
+    
+    # Get all profiles from credentials reader
+    profiles_data = credentials_reader.read_all_profiles()
+    profile_list = []
+    aws_call_slots = asyncio.Semaphore(MAX_CONCURRENT_PROFILE_VALIDATIONS)
+    
+    async def process_profile(profile_name: str, aws_profile: AWSProfile) -> AccountProfile:
+        # Build comprehensive profile with validation, bounding concurrent AWS calls
+        async with aws_call_slots:
+            return await _build_account_profile(
+                aws_profile, 
+                session_manager, 
+                client_factory,
+                is_default=(profile_name == "default"),
+                include_permissions=include_permissions
+            )
+    
+    if not validate_credentials:
+        # Skipping validation needs no AWS calls, so build profiles directly
+        results = []
+        for profile_name, aws_profile in profiles_data.profiles.items():
+            try:
+                results.append(_build_unvalidated_profile(aws_profile, is_default=(profile_name == "default")))
+            except Exception as e:
+                results.append(e)
+    else:
+        # Process all profiles concurrently; results keep the profile order
+        results = await asyncio.gather(
+            *(process_profile(name, profile) for name, profile in profiles_data.profiles.items()),
+            return_exceptions=True
+        )
+    
+    for (profile_name, aws_profile), result in zip(profiles_data.profiles.items(), results):
+        if isinstance(result, Exception):
+            logger.error(f"Error processing profile {profile_name}: {str(result)}")
+            if include_invalid:
+                # Create minimal profile entry for errored profiles
+                error_profile = _ACCOUNT_PROFILE_ADAPTER.validate_python(dict(
+                    profile_name=profile_name,
+                    profile_type=aws_profile.profile_type,
+                    region=aws_profile.region,
+                    output=aws_profile.output,
+                    validation=ProfileValidationInfo(
+                        is_valid=False,
+                        status=AccountStatus.UNKNOWN,
+                        account_id=None,
+                        user_arn=None,
+                        user_id=None,
+                        last_validated=datetime.now(timezone.utc),
+                        error=f"Processing error: {str(result)}"
+                    ),
+                    is_default=(profile_name == "default"),
+                    permissions_summary=None
+                ))
+                profile_list.append(error_profile)
+        
+        # Include invalid profiles if requested
+        elif include_invalid or result.validation.is_valid:
+            profile_list.append(result)
+    
+    # Calculate statistics in a single pass
+    valid_profiles = 0
+    default_profile = None
+    for profile in profile_list:
+        valid_profiles += profile.validation.is_valid
+        if default_profile is None and profile.is_default:
+            default_profile = profile.profile_name
+    invalid_profiles = len(profile_list) - valid_profiles
+    
+    # The envelope is encoded directly; AccountsResponse only documents the schema
+    stats = to_json({
+        "total_profiles": len(profile_list),
+        "valid_profiles": valid_profiles,
+        "invalid_profiles": invalid_profiles,
+        "default_profile": default_profile
+    })
+    generated_at = datetime.now(timezone.utc)
+    finished_at = time.monotonic()
+    
+    logger.info(f"Generated accounts response: {len(profile_list)} profiles ({valid_profiles} valid, {invalid_profiles} invalid)")
+    cache_entry = {
+        'body_prefix': (
+            b'{"profiles":'
+            + _PROFILES_ADAPTER.dump_json(
+                [profile.to_summary() for profile in profile_list], by_alias=True, exclude_none=True
+            )
+            + b','
+            + stats[1:-1]
+        ),
+        'body_suffix': f',"generated_at":"{generated_at.isoformat()}"}}'.encode(),
+        'files_fingerprint': to_json(files_fingerprint),
+        'timestamp': generated_at.isoformat().encode(),
+        'monotonic': repr(finished_at).encode(),
+        'clock_id': _CLOCK_ID,
+        'cache_duration': str(_get_cache_duration(finished_at - started_at)).encode()
+    }
+    for profile in profile_list:
+        cache_entry[f'profile:{profile.profile_name}'] = profile.to_json()
+    
+    return cache_entry
+
+
+def _is_cache_entry_fresh(cache_entry: Dict[str, bytes], session_manager: AWSSessionManager) -> bool:
+    """
+    Check whether a cache entry is within the cache window and matches the profile files
+    
+    Args:
+        cache_entry: Cache entry produced by _generate_accounts_entry
+        session_manager: Session manager instance
+        
+    Returns:
+        True if the entry can be served without refreshing
+    """
+    files_fingerprint = list(session_manager.credentials_reader.get_files_fingerprint())
+    return (
+        _get_cache_age(cache_entry) < int(cache_entry['cache_duration'])
+        and from_json(cache_entry.get('files_fingerprint', b'null')) == files_fingerprint
+    )
+
+
+def _get_cache_duration(generation_seconds: float) -> int:
+    """Get the cache duration for a response that took generation_seconds to build"""
+    duration = int(generation_seconds * CACHE_DURATION_PER_GENERATION_SECOND) + CACHE_MIN_DURATION_SECONDS
+    return min(duration, CACHE_MAX_DURATION_SECONDS)
+
+
+def _get_cache_retention(cache_entry: Dict[str, bytes]) -> int:
+    """Get how long to keep a cache entry; stale entries are still served while refreshing"""
+    return int(cache_entry['cache_duration']) * 2
+
+
+def _get_cache_age(cache_entry: Dict[str, bytes]) -> float:
+    """Get the age of a cache entry in seconds, immune to wall-clock jumps when generated locally"""
+    if cache_entry.get('clock_id') == _CLOCK_ID:
+        return time.monotonic() - float(cache_entry['monotonic'])
+    
+    generated_at = datetime.fromisoformat(cache_entry['timestamp'].decode())
+    return (datetime.now(timezone.utc) - generated_at).total_seconds()
+
+
+def _render_accounts_entry(cache_entry: Dict[str, bytes], cached: bool, stale: bool = False) -> Response:
+    """
+    Render a cached accounts entry with current cache information
+    
+    Args:
+        cache_entry: Cache entry produced by _generate_accounts_entry
+        cached: Whether the entry is being served from cache
+        stale: Whether the entry is served in place of a failed regeneration
+        
+    Returns:
+        JSON Response matching the AccountsResponse schema
+    """
+    cache_age = _get_cache_age(cache_entry) if cached else 0
+    cache_info = {
+        "cached": cached,
+        "cache_age_seconds": int(cache_age),
+        "expires_in_seconds": max(int(int(cache_entry['cache_duration']) - cache_age), 0)
+    }
+    if stale:
+        cache_info["stale"] = True
+    
+    body = (
+        cache_entry['body_prefix']
+        + b',"cache_info":'
+        + to_json(cache_info)
+        + cache_entry['body_suffix']
     )
+    return Response(content=body, media_type="application/json")
+
+
+async def _generate_and_cache_accounts_entry(
+    cache_key: str,
+    include_invalid: bool,
+    validate_credentials: bool,
+    include_permissions: bool,
+    session_manager: AWSSessionManager,
+    client_factory: AWSServiceClientFactory
+) -> Dict[str, bytes]:
+    """
+    Generate and cache an accounts entry, sharing one generation among concurrent callers
+    
+    Callers arriving while an entry for the same cache key is being generated
+    await that generation instead of starting their own, so a cache miss
+    under load validates each profile once.
+    
+    Args:
+        cache_key: Accounts cache key
+        include_invalid: Whether to include profiles with invalid credentials
+        validate_credentials: Whether to validate credentials
+        include_permissions: Whether to include permissions summary
+        session_manager: Session manager instance
+        client_factory: Client factory instance
+        
+    Returns:
+        Cache entry produced by _generate_accounts_entry
+    """
+    generation = _inflight_generations.get(cache_key)
+    if generation is None:
+        async def generate() -> Dict[str, bytes]:
+            cache_entry = await _generate_accounts_entry(
+                include_invalid, validate_credentials, include_permissions,
+                session_manager, client_factory
+            )
+            await response_cache.set(cache_key, cache_entry, _get_cache_retention(cache_entry))
+            return cache_entry
+        
+        generation = asyncio.create_task(generate())
+        _inflight_generations[cache_key] = generation
+        generation.add_done_callback(lambda _: _inflight_generations.pop(cache_key, None))
+    else:
+        logger.info("Awaiting in-progress accounts generation")
+    
+    # Shielded so one disconnecting caller does not cancel the others' generation
+    return await asyncio.shield(generation)
+
+
+async def _refresh_accounts_cache(
+    cache_key: str,
+    include_invalid: bool,
+    validate_credentials: bool,
+    include_permissions: bool,
+    session_manager: AWSSessionManager,
+    client_factory: AWSServiceClientFactory
+) -> None:
+    """Regenerate a stale accounts cache entry in the background"""
+    try:
+        await _generate_and_cache_accounts_entry(
+            cache_key, include_invalid, validate_credentials, include_permissions,
+            session_manager, client_factory
+        )
+    except Exception as e:
+        logger.error(f"Background accounts cache refresh failed: {str(e)}")
+    finally:
+        _refresh_tasks.pop(cache_key, None)
 
 
 @router.get("/accounts",
            summary="List AWS accounts and profiles",
-           description="Get comprehensive information about all available AWS profiles with metadata, validation status, and permissions",
+           description="Get a summary of all available AWS profiles with validation status. Use /accounts/{profile_name} for full profile details",
            response_model=AccountsResponse,
            responses={
                200: {"description": "Successful response with accounts information"},
@@ -266,152 +667,139 @@ async def list_accounts(
     use_cache: bool = Query(True, description="Use cached response if available"),
     session_manager: AWSSessionManager = Depends(get_session_manager),
     client_factory: AWSServiceClientFactory = Depends(get_client_factory)
-) -> AccountsResponse:
+) -> Response:
     """
-    List all available AWS accounts and profiles with comprehensive metadata
+    List all available AWS accounts and profiles
     
-    This endpoint provides detailed information about AWS profiles including:
-    - Profile names, types, and configuration
-    - Credential validation status and account information
-    - Available regions and basic permissions summary
-    - Role and SSO configuration details
+    This endpoint provides a compact summary of each AWS profile:
+    - Profile name, type, and default flag
+    - Credential validation status and account ID
+    
+    Full profile details (regions, permissions, role and SSO configuration)
+    are served by the /accounts/{profile_name} endpoint.
     
     Args:
         include_invalid: Whether to include profiles with invalid credentials
         validate_credentials: Whether to validate credentials (set to False for faster response)
         include_permissions: Whether to include permissions summary (slower but more detailed)
-        use_cache: Whether to use cached response (15-minute cache)
+        use_cache: Whether to use cached response (1 minute to 1 hour, longer for slower responses)
         
     Returns:
-        AccountsResponse with comprehensive profile information
+        JSON response matching the AccountsResponse schema
     """
     try:
-        # Check cache first
         cache_key = f"accounts:{include_invalid}:{validate_credentials}:{include_permissions}"
+        cache_entry = await response_cache.get(cache_key) if use_cache else None
         
-        if use_cache and cache_key in _accounts_cache:
-            cache_entry = _accounts_cache[cache_key]
-            cache_age = (datetime.utcnow() - cache_entry['timestamp']).total_seconds()
+        if cache_entry:
+            cache_age = _get_cache_age(cache_entry)
             
-            if cache_age < CACHE_DURATION_SECONDS:
+            if not _is_cache_entry_fresh(cache_entry, session_manager):
+                # Stale-while-revalidate: serve the stale body, rebuild in the background
+                if cache_key not in _refresh_tasks:
+                    logger.info(f"Accounts cache stale (age: {cache_age:.1f}s), refreshing in background")
+                    _refresh_tasks[cache_key] = asyncio.create_task(_refresh_accounts_cache(
+                        cache_key, include_invalid, validate_credentials, include_permissions,
+                        session_manager, client_factory
+                    ))
+            else:
                 logger.info(f"Returning cached accounts response (age: {cache_age:.1f}s)")
-                response = cache_entry['data']
-                response.cache_info = {
-                    "cached": True,
-                    "cache_age_seconds": int(cache_age),
-                    "expires_in_seconds": int(CACHE_DURATION_SECONDS - cache_age)
-                }
-                return response
+            
+            return _render_accounts_entry(cache_entry, cached=True)
         
         logger.info("Generating fresh accounts response...")
+        try:
+            cache_entry = await _generate_and_cache_accounts_entry(
+                cache_key, include_invalid, validate_credentials, include_permissions,
+                session_manager, client_factory
+            )
+        except Exception as e:
+            # Serve the last cached response, regardless of age, rather than failing
+            stale_entry = await response_cache.get(cache_key)
+            if not stale_entry:
+                raise
+            
+            logger.warning(f"Accounts generation failed, serving stale cached response: {str(e)}")
+            return _render_accounts_entry(stale_entry, cached=True, stale=True)
         
-        # Get all profiles from credentials reader
-        profiles_data = session_manager.credentials_reader.read_all_profiles()
-        profile_list = []
+        return _render_accounts_entry(cache_entry, cached=False)
         
-        # Process each profile
-        for profile_name, aws_profile in profiles_data.profiles.items():
-            try:
-                # Skip credential validation if requested
-                if not validate_credentials:
-                    validation_info = ProfileValidationInfo(
-                        is_valid=True,
-                        status=AccountStatus.UNKNOWN,
-                        account_id=None,
-                        user_arn=None,
-                        user_id=None,
-                        last_validated=None,
-                        error="Validation skipped"
-                    )
-                    
-                    account_profile = AccountProfile(
-                        profile_name=aws_profile.name,
-                        profile_type=aws_profile.profile_type,
-                        region=aws_profile.region,
-                        output=aws_profile.output,
-                        validation=validation_info,
-                        role_arn=aws_profile.role_arn,
-                        source_profile=aws_profile.source_profile,
-                        sso_start_url=aws_profile.sso_start_url,
-                        sso_region=aws_profile.sso_region,
-                        sso_account_id=aws_profile.sso_account_id,
-                        sso_role_name=aws_profile.sso_role_name,
-                        sso_session=aws_profile.sso_session,
-                        is_default=(profile_name == "default"),
-                        available_regions=['us-east-1', 'us-west-2', 'eu-west-1'],
-                        permissions_summary=None
-                    )
-                else:
-                    # Build comprehensive profile with validation
-                    account_profile = await _build_account_profile(
-                        aws_profile, 
-                        session_manager, 
-                        client_factory if include_permissions else None,
-                        is_default=(profile_name == "default")
-                    )
-                
-                # Include invalid profiles if requested
-                if include_invalid or account_profile.validation.is_valid:
-                    profile_list.append(account_profile)
-                    
-            except Exception as e:
-                logger.error(f"Error processing profile {profile_name}: {str(e)}")
-                if include_invalid:
-                    # Create minimal profile entry for errored profiles
-                    error_profile = AccountProfile(
-                        profile_name=profile_name,
-                        profile_type=aws_profile.profile_type,
-                        region=aws_profile.region,
-                        output=aws_profile.output,
-                        validation=ProfileValidationInfo(
-                            is_valid=False,
-                            status=AccountStatus.UNKNOWN,
-                            account_id=None,
-                            user_arn=None,
-                            user_id=None,
-                            last_validated=datetime.utcnow(),
-                            error=f"Processing error: {str(e)}"
-                        ),
-                        is_default=(profile_name == "default"),
-                        available_regions=[],
-                        permissions_summary=None
-                    )
-                    profile_list.append(error_profile)
+    except Exception as e:
+        logger.error(f"Error in accounts endpoint: {str(e)}")
+        raise HTTPException(
+            status_code=500, 
+            detail=f"Failed to retrieve accounts information: {str(e)}"
+        )
+
+
+@router.get("/accounts/{profile_name}",
+           summary="Get AWS account profile details",
+           description="Get full information about a single AWS profile including regions, permissions, and role/SSO configuration",
+           response_model=AccountProfile,
+           responses={
+               200: {"description": "Successful response with profile details"},
+               404: {"description": "Profile not found", "model": ErrorResponse},
+               500: {"description": "Internal server error", "model": ErrorResponse}
+           })
+@rate_limit_default()
+async def get_account(
+    request: Request,
+    profile_name: str,
+    validate_credentials: bool = Query(True, description="Perform credential validation"),
+    include_permissions: bool = Query(False, description="Include basic permissions summary (slower)"),
+    use_cache: bool = Query(True, description="Use cached profile if available"),
+    session_manager: AWSSessionManager = Depends(get_session_manager),
+    client_factory: AWSServiceClientFactory = Depends(get_client_factory)
+) -> Response:
+    """
+    Get full account profile information for a single AWS profile
+    
+    Profiles built by a recent /accounts request are served from its cache;
+    otherwise the profile is read and built on demand.
+    
+    Args:
+        profile_name: AWS profile name
+        validate_credentials: Whether to validate credentials
+        include_permissions: Whether to include permissions summary
+        use_cache: Whether to use a cached profile
         
-        # Calculate statistics
-        valid_profiles = len([p for p in profile_list if p.validation.is_valid])
-        invalid_profiles = len(profile_list) - valid_profiles
-        default_profile = next((p.profile_name for p in profile_list if p.is_default), None)
+    Returns:
+        JSON response matching the AccountProfile schema
+    """
+    try:
+        if use_cache:
+            for include_invalid in (True, False):
+                cache_key = f"accounts:{include_invalid}:{validate_credentials}:{include_permissions}"
+                cache_entry = await response_cache.get(cache_key)
+                profile_json = cache_entry and cache_entry.get(f'profile:{profile_name}')
+                if profile_json and _is_cache_entry_fresh(cache_entry, session_manager):
+                    return Response(content=profile_json, media_type="application/json")
         
-        # Create response
-        response = AccountsResponse(
-            profiles=profile_list,
-            total_profiles=len(profile_list),
-            valid_profiles=valid_profiles,
-            invalid_profiles=invalid_profiles,
-            default_profile=default_profile,
-            cache_info={
-                "cached": False,
-                "cache_age_seconds": 0,
-                "expires_in_seconds": CACHE_DURATION_SECONDS
-            },
-            generated_at=datetime.utcnow()
-        )
+        aws_profile = session_manager.credentials_reader.read_profile(profile_name)
         
-        # Cache the response
-        _accounts_cache[cache_key] = {
-            'data': response,
-            'timestamp': datetime.utcnow()
-        }
+        if validate_credentials:
+            account_profile = await _build_account_profile(
+                aws_profile,
+                session_manager,
+                client_factory,
+                is_default=(profile_name == "default"),
+                include_permissions=include_permissions
+            )
+        else:
+            account_profile = _build_unvalidated_profile(
+                aws_profile,
+                is_default=(profile_name == "default")
+            )
         
-        logger.info(f"Generated accounts response: {len(profile_list)} profiles ({valid_profiles} valid, {invalid_profiles} invalid)")
-        return response
+        return Response(content=account_profile.to_json(), media_type="application/json")
         
+    except AWSProfileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.error(f"Error in accounts endpoint: {str(e)}")
+        logger.error(f"Error retrieving account profile {profile_name}: {str(e)}")
         raise HTTPException(
-            status_code=500, 
-            detail=f"Failed to retrieve accounts information: {str(e)}"
+            status_code=500,
+            detail=f"Failed to retrieve account profile: {str(e)}"
         )
 
 
@@ -427,13 +815,13 @@ async def clear_accounts_cache(request: Request) -> Dict[str, Any]:
         Cache clearing results
     """
     try:
-        cleared_entries = len(_accounts_cache)
-        _accounts_cache.clear()
+        cleared_entries = await response_cache.clear("accounts:")
+        _validation_cache.clear()
         
         return {
             "message": f"Successfully cleared {cleared_entries} cache entries",
             "cleared_entries": cleared_entries,
-            "cache_duration_seconds": CACHE_DURATION_SECONDS
+            "cache_duration_seconds": CACHE_MAX_DURATION_SECONDS
         }
         
     except Exception as e:
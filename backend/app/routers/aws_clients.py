@@ -1,9 +1,14 @@
 """
 AWS Client Factory API endpoints
 """
+import asyncio
+import base64
 import logging
+import re
 from typing import Optional, Dict, Any, List, Union
 from fastapi import APIRouter, HTTPException, Depends, Query, Path, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic_core import to_json
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
@@ -18,12 +23,87 @@ from app.aws.client_factory import (
 from app.aws.session_manager import AWSSessionManager, get_session_manager
 from app.models.aws import AWSSessionError, AWSProfileNotFoundError
 from app.core.security import rate_limit_default
+from app.core.cache import cacheable_json_response, compute_etag
+from app.core.responses import FastJSONResponse
 
 logger = logging.getLogger(__name__)
 
+# Availability checks run at once when building a matrix
+MAX_CONCURRENT_AVAILABILITY_CHECKS = 32
+
+# Matrix defaults when services or regions are not given
+DEFAULT_MATRIX_SERVICES = ('ec2', 's3', 'rds', 'lambda')
+DEFAULT_MATRIX_REGIONS = ('us-east-1', 'us-west-2', 'eu-west-1')
+
+# Compact matrix cell codes: a cell holds the index of its availability here
+MATRIX_AVAILABILITY_CODES = tuple(RegionAvailability)
+_MATRIX_CODE_BY_AVAILABILITY = {
+    availability: code for code, availability in enumerate(MATRIX_AVAILABILITY_CODES)
+}
+
+# Items of a comma-separated query parameter, without surrounding whitespace
+_LIST_ITEM_PATTERN = re.compile(r"[^,\s]+")
+
+# Supported services by category, static for the lifetime of the process
+SERVICES_BY_CATEGORY: Dict[str, List[Dict[str, str]]] = {
+    "compute": [
+        {"name": "EC2", "identifier": "ec2", "description": "Elastic Compute Cloud"},
+        {"name": "Lambda", "identifier": "lambda", "description": "Serverless Functions"},
+        {"name": "ECS", "identifier": "ecs", "description": "Elastic Container Service"},
+        {"name": "EKS", "identifier": "eks", "description": "Elastic Kubernetes Service"},
+        {"name": "Batch", "identifier": "batch", "description": "Batch Computing"}
+    ],
+    "storage": [
+        {"name": "S3", "identifier": "s3", "description": "Simple Storage Service"},
+        {"name": "EBS", "identifier": "ebs", "description": "Elastic Block Store"},
+        {"name": "EFS", "identifier": "efs", "description": "Elastic File System"},
+        {"name": "FSx", "identifier": "fsx", "description": "File Systems"}
+    ],
+    "database": [
+        {"name": "RDS", "identifier": "rds", "description": "Relational Database Service"},
+        {"name": "DynamoDB", "identifier": "dynamodb", "description": "NoSQL Database"},
+        {"name": "Redshift", "identifier": "redshift", "description": "Data Warehouse"},
+        {"name": "DocumentDB", "identifier": "docdb", "description": "Document Database"},
+        {"name": "Neptune", "identifier": "neptune", "description": "Graph Database"}
+    ],
+    "networking": [
+        {"name": "VPC", "identifier": "ec2", "description": "Virtual Private Cloud"},
+        {"name": "ELB", "identifier": "elbv2", "description": "Elastic Load Balancing"},
+        {"name": "Route53", "identifier": "route53", "description": "DNS Service"},
+        {"name": "CloudFront", "identifier": "cloudfront", "description": "Content Delivery Network"}
+    ],
+    "security": [
+        {"name": "IAM", "identifier": "iam", "description": "Identity and Access Management"},
+        {"name": "STS", "identifier": "sts", "description": "Security Token Service"},
+        {"name": "Secrets Manager", "identifier": "secretsmanager", "description": "Secrets Management"},
+        {"name": "KMS", "identifier": "kms", "description": "Key Management Service"}
+    ],
+    "monitoring": [
+        {"name": "CloudWatch", "identifier": "cloudwatch", "description": "Monitoring and Observability"},
+        {"name": "CloudTrail", "identifier": "cloudtrail", "description": "API Logging"},
+        {"name": "X-Ray", "identifier": "xray", "description": "Distributed Tracing"}
+    ],
+    "messaging": [
+        {"name": "SNS", "identifier": "sns", "description": "Simple Notification Service"},
+        {"name": "SQS", "identifier": "sqs", "description": "Simple Queue Service"},
+        {"name": "SES", "identifier": "ses", "description": "Simple Email Service"}
+    ]
+}
+
+# The services listing never changes, so it is encoded once at import
+SERVICES_RESPONSE_BODY = to_json({
+    "services": SERVICES_BY_CATEGORY,
+    "total_services": sum(len(services) for services in SERVICES_BY_CATEGORY.values())
+})
+SERVICES_RESPONSE_ETAG = compute_etag(SERVICES_RESPONSE_BODY)
+
+# Service and region listings change rarely, so browsers and proxies may cache them
+STATIC_LISTING_CACHE_CONTROL = "public, max-age=3600"
+
 router = APIRouter(
     prefix="/api/aws/clients",
     tags=["AWS Clients"],
+    default_response_class=FastJSONResponse,
     responses={
         404: {"description": "Service or profile not found"},
         500: {"description": "Client factory error"}
@@ -35,67 +115,16 @@ router = APIRouter(
            summary="List supported AWS services",
            description="Get list of all supported AWS services with their identifiers")
 @rate_limit_default()
-async def list_supported_services(request: Request) -> Dict[str, Any]:
+async def list_supported_services(request: Request) -> Response:
     """
     List all supported AWS services
     
     Returns:
-        Dictionary of service categories and their services
+        JSON response with service categories and their services
     """
-    try:
-        services_by_category = {
-            "compute": [
-                {"name": "EC2", "identifier": "ec2", "description": "Elastic Compute Cloud"},
-                {"name": "Lambda", "identifier": "lambda", "description": "Serverless Functions"},
-                {"name": "ECS", "identifier": "ecs", "description": "Elastic Container Service"},
-                {"name": "EKS", "identifier": "eks", "description": "Elastic Kubernetes Service"},
-                {"name": "Batch", "identifier": "batch", "description": "Batch Computing"}
-            ],
-            "storage": [
-                {"name": "S3", "identifier": "s3", "description": "Simple Storage Service"},
-                {"name": "EBS", "identifier": "ebs", "description": "Elastic Block Store"},
-                {"name": "EFS", "identifier": "efs", "description": "Elastic File System"},
-                {"name": "FSx", "identifier": "fsx", "description": "File Systems"}
-            ],
-            "database": [
-                {"name": "RDS", "identifier": "rds", "description": "Relational Database Service"},
-                {"name": "DynamoDB", "identifier": "dynamodb", "description": "NoSQL Database"},
-                {"name": "Redshift", "identifier": "redshift", "description": "Data Warehouse"},
-                {"name": "DocumentDB", "identifier": "docdb", "description": "Document Database"},
-                {"name": "Neptune", "identifier": "neptune", "description": "Graph Database"}
-            ],
-            "networking": [
-                {"name": "VPC", "identifier": "ec2", "description": "Virtual Private Cloud"},
-                {"name": "ELB", "identifier": "elbv2", "description": "Elastic Load Balancing"},
-                {"name": "Route53", "identifier": "route53", "description": "DNS Service"},
-                {"name": "CloudFront", "identifier": "cloudfront", "description": "Content Delivery Network"}
-            ],
-            "security": [
-                {"name": "IAM", "identifier": "iam", "description": "Identity and Access Management"},
-                {"name": "STS", "identifier": "sts", "description": "Security Token Service"},
-                {"name": "Secrets Manager", "identifier": "secretsmanager", "description": "Secrets Management"},
-                {"name": "KMS", "identifier": "kms", "description": "Key Management Service"}
-            ],
-            "monitoring": [
-                {"name": "CloudWatch", "identifier": "cloudwatch", "description": "Monitoring and Observability"},
-                {"name": "CloudTrail", "identifier": "cloudtrail", "description": "API Logging"},
-                {"name": "X-Ray", "identifier": "xray", "description": "Distributed Tracing"}
-            ],
-            "messaging": [
-                {"name": "SNS", "identifier": "sns", "description": "Simple Notification Service"},
-                {"name": "SQS", "identifier": "sqs", "description": "Simple Queue Service"},
-                {"name": "SES", "identifier": "ses", "description": "Simple Email Service"}
-            ]
-        }
-        
-        return {
-            "services": services_by_category,
-            "total_services": sum(len(services) for services in services_by_category.values())
-        }
-        
-    except Exception as e:
-        logger.error(f"Error listing services: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to list services: {str(e)}")
+    return cacheable_json_response(
+        request, SERVICES_RESPONSE_BODY, SERVICES_RESPONSE_ETAG, STATIC_LISTING_CACHE_CONTROL
+    )
 
 
 @router.get("/regions",
@@ -106,7 +135,7 @@ async def list_regions(
     request: Request,
     service: Optional[str] = Query(None, description="AWS service name to check region availability"),
     client_factory: AWSServiceClientFactory = Depends(get_client_factory)
-) -> Dict[str, Any]:
+) -> Response:
     """
     List AWS regions, optionally filtered by service availability
     
@@ -114,24 +143,26 @@ async def list_regions(
         service: Optional AWS service name to filter regions
         
     Returns:
-        List of regions with availability information
+        JSON list of regions with availability information, with an ETag for revalidation
     """
     try:
         if service:
             # Get regions available for specific service
             available_regions = await client_factory.get_available_regions(service)
-            return {
+            body = to_json({
                 "service": service,
                 "available_regions": available_regions,
                 "total_regions": len(available_regions)
-            }
+            })
         else:
             # Get all regions
             all_regions = await client_factory.get_all_regions()
-            return {
+            body = to_json({
                 "all_regions": all_regions,
                 "total_regions": len(all_regions)
-            }
+            })
+        
+        return cacheable_json_response(request, body, compute_etag(body), STATIC_LISTING_CACHE_CONTROL)
             
     except Exception as e:
         logger.error(f"Error listing regions: {str(e)}")
@@ -206,12 +237,15 @@ async def test_service_client(
                 detail=f"Service '{service}' is not available in region '{region}'"
             )
         
-        # Try to create the client
-        client = await client_factory.get_client(
-            service_name=service,
-            profile_name=profile_name,
-            region=region
-        )
+        # Reuse a cached client, or try to create the client
+        client = client_factory.peek_client(service, profile_name, region)
+        cached = client is not None
+        if not cached:
+            client = await client_factory.get_client(
+                service_name=service,
+                profile_name=profile_name,
+                region=region
+            )
         
         return {
             "success": True,
@@ -220,7 +254,8 @@ async def test_service_client(
             "region": region,
             "client_type": str(type(client).__name__),
             "availability": availability.value,
-            "message": f"Successfully created {service} client"
+            "cached": cached,
+            "message": f"Using cached {service} client" if cached else f"Successfully created {service} client"
         }
         
     except AWSServiceError as e:
@@ -300,44 +335,99 @@ async def get_availability_matrix(
     request: Request,
     services: Optional[str] = Query(None, description="Comma-separated list of services"),
     regions: Optional[str] = Query(None, description="Comma-separated list of regions"),
+    verbose: bool = Query(False, description="Expand every cell into a nested JSON object"),
     client_factory: AWSServiceClientFactory = Depends(get_client_factory)
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get service availability matrix across multiple regions
     
     Args:
         services: Comma-separated list of services to check
         regions: Comma-separated list of regions to check
+        verbose: Whether to expand every cell into a nested JSON object
         
     Returns:
-        Availability matrix with service-region combinations
+        Compact availability matrix: one code per service-region cell, row
+        by service, packed as base64 bytes and decoded with
+        availability_codes. With verbose, the nested matrix is streamed one
+        service row at a time instead.
     """
     try:
-        # Parse input parameters
-        service_list = services.split(',') if services else ['ec2', 's3', 'rds', 'lambda']
-        region_list = regions.split(',') if regions else ['us-east-1', 'us-west-2', 'eu-west-1']
+        # Parse input parameters, skipping whitespace and empty entries; repeated
+        # names are dropped, keeping their first position, so each service and
+        # region appears once as a matrix key
+        service_list = list(dict.fromkeys(_LIST_ITEM_PATTERN.findall(services))) if services else list(DEFAULT_MATRIX_SERVICES)
+        region_list = list(dict.fromkeys(_LIST_ITEM_PATTERN.findall(regions))) if regions else list(DEFAULT_MATRIX_REGIONS)
         
-        # Clean up the lists
-        service_list = [s.strip() for s in service_list if s.strip()]
-        region_list = [r.strip() for r in region_list if r.strip()]
+        # Check all service-region combinations concurrently, bounding the fan-out
+        check_slots = asyncio.Semaphore(MAX_CONCURRENT_AVAILABILITY_CHECKS)
         
-        # Build availability matrix
-        matrix = {}
-        for service in service_list:
-            matrix[service] = {}
-            for region in region_list:
-                availability = await client_factory.check_service_availability(service, region)
-                matrix[service][region] = {
+        async def check(service: str, region: str) -> RegionAvailability:
+            async with check_slots:
+                return await client_factory.check_service_availability(service, region)
+        
+        # One code byte per cell, indexed by service_index * len(region_list) + region_index
+        region_count = len(region_list)
+        codes = bytearray(len(service_list) * region_count)
+        
+        async def check_row(service_index: int) -> None:
+            service = service_list[service_index]
+            results = await asyncio.gather(
+                *(check(service, region) for region in region_list),
+                return_exceptions=True
+            )
+            offset = service_index * region_count
+            for region_index, availability in enumerate(results):
+                if isinstance(availability, Exception):
+                    logger.warning(
+                        f"Could not check availability for {service} in {region_list[region_index]}: {str(availability)}"
+                    )
+                    availability = RegionAvailability.UNKNOWN
+                codes[offset + region_index] = _MATRIX_CODE_BY_AVAILABILITY[availability]
+        
+        if not verbose:
+            await asyncio.gather(*(check_row(index) for index in range(len(service_list))))
+            return FastJSONResponse({
+                "services_checked": service_list,
+                "regions_checked": region_list,
+                "availability_codes": [availability.value for availability in MATRIX_AVAILABILITY_CODES],
+                "codes": base64.b64encode(codes).decode(),
+                "total_combinations": len(codes)
+            })
+        
+        # Start every row up front, then stream them in order as each completes
+        row_tasks = [asyncio.ensure_future(check_row(index)) for index in range(len(service_list))]
+        
+        def expand_row(service_index: int) -> Dict[str, Dict[str, Any]]:
+            offset = service_index * region_count
+            row = {}
+            for region_index, region in enumerate(region_list):
+                availability = MATRIX_AVAILABILITY_CODES[codes[offset + region_index]]
+                row[region] = {
                     "availability": availability.value,
                     "available": availability == RegionAvailability.AVAILABLE
                 }
+            return row
         
-        return {
-            "availability_matrix": matrix,
-            "services_checked": service_list,
-            "regions_checked": region_list,
-            "total_combinations": len(service_list) * len(region_list)
-        }
+        async def stream_matrix():
+            try:
+                yield b'{"availability_matrix":{'
+                for index, (service, row_task) in enumerate(zip(service_list, row_tasks)):
+                    await row_task
+                    separator = b"," if index else b""
+                    yield separator + to_json(service) + b":" + to_json(expand_row(index))
+                yield (
+                    b'},"services_checked":' + to_json(service_list)
+                    + b',"regions_checked":' + to_json(region_list)
+                    + b',"total_combinations":' + to_json(len(codes))
+                    + b"}"
+                )
+            finally:
+                # Client disconnected mid-stream, stop outstanding checks
+                for row_task in row_tasks:
+                    row_task.cancel()
+        
+        return StreamingResponse(stream_matrix(), media_type="application/json")
         
     except Exception as e:
         logger.error(f"Error generating availability matrix: {str(e)}")
@@ -1,16 +1,23 @@
 """
 AWS Profiles API endpoints
 """
-from typing import List, Dict, Any
+import asyncio
+from typing import List, Dict, Any, Optional, Tuple
 from fastapi import APIRouter, status, Request, HTTPException
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
 from app.aws.credentials import AWSCredentialsReader
-from app.models.aws import AWSCredentialError, AWSProfileNotFoundError
+from app.models.aws import AWSCredentialError, AWSProfileNotFoundError, AWSProfileCollection
 from app.models.responses import ErrorResponse
 from app.core.security import rate_limit_default
+from app.core.cache import cacheable_json_response, compute_etag
+from app.core.responses import FastJSONResponse
 
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
+
+# Shared reader, so parsed profiles are reused until the AWS files change
+_credentials_reader = AWSCredentialsReader()
 
 
 class ProfileInfo(BaseModel):
@@ -83,9 +90,112 @@ class ProfileDetailResponse(BaseModel):
         }
 
 
+# Profile listing built from a parsed profile collection, reused while the
+# reader returns the same (unchanged) collection
+_profile_list_cache: Optional[Tuple[AWSProfileCollection, bytes, str]] = None
+
+# Profiles can change whenever the AWS files are edited, so clients must revalidate
+PROFILE_LISTING_CACHE_CONTROL = "private, no-cache"
+
+# Serializes worker-thread use of the shared reader, whose caches are not thread-safe
+_reader_lock: Optional[asyncio.Lock] = None
+
+
+def _get_reader_lock() -> asyncio.Lock:
+    """Get the reader lock, created on first use so it binds to the running event loop"""
+    global _reader_lock
+    if _reader_lock is None:
+        _reader_lock = asyncio.Lock()
+    return _reader_lock
+
+
+def _build_profile_list() -> Tuple[bytes, str]:
+    """
+    Build the serialized profile listing, reusing it while the parsed profiles are unchanged
+    
+    Blocking: reads and parses the AWS files when they changed.
+    
+    Returns:
+        Tuple of (ProfileListResponse JSON, ETag)
+    """
+    global _profile_list_cache
+    
+    profile_collection = _credentials_reader.read_all_profiles()
+    
+    if _profile_list_cache is not None and _profile_list_cache[0] is profile_collection:
+        return _profile_list_cache[1], _profile_list_cache[2]
+    
+    # Resolve effective regions for all profiles in one pass
+    profile_names = profile_collection.list_profiles()
+    effective_regions = _credentials_reader.get_effective_regions(profile_names)
+    
+    # Profiles are already validated models, so the response is built without re-validation
+    profiles = [
+        ProfileInfo.model_construct(
+            name=profile.name,
+            profile_type=profile.profile_type.value,
+            region=effective_regions[profile.name],
+            is_valid=profile.is_valid,
+            requires_mfa=profile.requires_mfa
+        )
+        for profile in profile_collection.profiles.values()
+    ]
+    
+    profile_list = ProfileListResponse.model_construct(
+        profiles=profiles,
+        total_count=profile_collection.profile_count,
+        valid_count=profile_collection.valid_profile_count
+    )
+    body = profile_list.model_dump_json().encode()
+    etag = compute_etag(body)
+    _profile_list_cache = (profile_collection, body, etag)
+    return body, etag
+
+
+def _build_profile_detail(profile_name: str) -> ProfileDetailResponse:
+    """
+    Build detailed information for a profile
+    
+    Blocking: reads and parses the AWS files when they changed.
+    
+    Args:
+        profile_name: Name of the AWS profile to retrieve
+    
+    Returns:
+        ProfileDetailResponse: Detailed profile information
+        
+    Raises:
+        AWSProfileNotFoundError: If the profile does not exist
+    """
+    # Use the cached parsed profile when available; read_profile raises
+    # the appropriate error for missing or invalid profiles
+    profile = _credentials_reader.read_all_profiles().get_profile(profile_name)
+    if profile is None:
+        profile = _credentials_reader.read_profile(profile_name)
+    
+    # Get effective region  
+    effective_region = _credentials_reader.get_effective_region(profile_name)
+    
+    # Get profile configuration without sensitive data
+    config = profile.to_dict(include_credentials=False)
+    
+    # Remove internal fields
+    config.pop('name', None)
+    config.pop('credentials', None)
+    
+    # Built from an already-validated profile, so construction skips re-validation
+    return ProfileDetailResponse.model_construct(
+        name=profile.name,
+        profile_type=profile.profile_type.value,
+        region=effective_region,
+        is_valid=profile.is_valid,
+        requires_mfa=profile.requires_mfa,
+        configuration=config
+    )
+
+
 @router.get(
     "/profiles",
-    response_model=ProfileListResponse,
     status_code=status.HTTP_200_OK,
     summary="List AWS Profiles",
     description="List all available AWS profiles with basic information",
@@ -106,7 +216,7 @@ class ProfileDetailResponse(BaseModel):
     },
 )
 @rate_limit_default()
-async def list_aws_profiles(request: Request) -> ProfileListResponse:
+async def list_aws_profiles(request: Request) -> Response:
     """
     List all available AWS profiles from ~/.aws/credentials and ~/.aws/config
     
@@ -114,32 +224,23 @@ async def list_aws_profiles(request: Request) -> ProfileListResponse:
     without exposing sensitive credential information.
     
     Returns:
-        ProfileListResponse: List of AWS profiles with metadata
+        JSON response matching ProfileListResponse, with an ETag for revalidation
     """
     try:
-        credentials_reader = AWSCredentialsReader()
-        profile_collection = credentials_reader.read_all_profiles()
-        
-        profiles = []
-        for profile_name in profile_collection.list_profiles():
-            profile = profile_collection.get_profile(profile_name)
-            if profile:
-                # Get effective region
-                effective_region = credentials_reader.get_effective_region(profile_name)
-                
-                profiles.append(ProfileInfo(
-                    name=profile.name,
-                    profile_type=profile.profile_type.value,
-                    region=effective_region,
-                    is_valid=profile.is_valid,
-                    requires_mfa=profile.requires_mfa
-                ))
+        # Serve the cached listing without leaving the event loop when the files are unchanged
+        profile_collection = _credentials_reader.get_cached_profiles()
+        if (
+            profile_collection is not None
+            and _profile_list_cache is not None
+            and _profile_list_cache[0] is profile_collection
+        ):
+            body, etag = _profile_list_cache[1], _profile_list_cache[2]
+        else:
+            # Parse the AWS files in a worker thread
+            async with _get_reader_lock():
+                body, etag = await asyncio.to_thread(_build_profile_list)
         
-        return ProfileListResponse(
-            profiles=profiles,
-            total_count=profile_collection.profile_count,
-            valid_count=profile_collection.valid_profile_count
-        )
+        return cacheable_json_response(request, body, etag, PROFILE_LISTING_CACHE_CONTROL)
         
     except AWSCredentialError as e:
         raise HTTPException(
@@ -150,7 +251,6 @@ async def list_aws_profiles(request: Request) -> ProfileListResponse:
 
 @router.get(
     "/profiles/{profile_name}",
-    response_model=ProfileDetailResponse,
     status_code=status.HTTP_200_OK,
     summary="Get AWS Profile Details",
     description="Get detailed information about a specific AWS profile",
@@ -175,7 +275,7 @@ async def list_aws_profiles(request: Request) -> ProfileListResponse:
     },
 )
 @rate_limit_default()
-async def get_aws_profile(request: Request, profile_name: str) -> ProfileDetailResponse:
+async def get_aws_profile(request: Request, profile_name: str) -> Response:
     """
     Get detailed information about a specific AWS profile.
     
@@ -186,30 +286,15 @@ async def get_aws_profile(request: Request, profile_name: str) -> ProfileDetailR
         profile_name: Name of the AWS profile to retrieve
     
     Returns:
-        ProfileDetailResponse: Detailed profile information
+        JSON response matching ProfileDetailResponse
     """
     try:
-        credentials_reader = AWSCredentialsReader()
-        profile = credentials_reader.read_profile(profile_name)
-        
-        # Get effective region  
-        effective_region = credentials_reader.get_effective_region(profile_name)
+        # Reading the profile may parse the AWS files, so it runs in a worker thread
+        async with _get_reader_lock():
+            profile_detail = await asyncio.to_thread(_build_profile_detail, profile_name)
         
-        # Get profile configuration without sensitive data
-        config = profile.to_dict(include_credentials=False)
-        
-        # Remove internal fields
-        config.pop('name', None)
-        config.pop('credentials', None)
-        
-        return ProfileDetailResponse(
-            name=profile.name,
-            profile_type=profile.profile_type.value,
-            region=effective_region,
-            is_valid=profile.is_valid,
-            requires_mfa=profile.requires_mfa,
-            configuration=config
-        )
+        # Serialized directly, without a response_model validation pass
+        return FastJSONResponse(profile_detail)
         
     except AWSProfileNotFoundError as e:
         raise HTTPException(
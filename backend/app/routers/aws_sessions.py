@@ -2,18 +2,74 @@
 AWS Session Management API endpoints
 """
 import logging
-from typing import Optional, Dict, Any
-from fastapi import APIRouter, HTTPException, Depends, Query
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from typing_extensions import TypedDict
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
 from app.aws.session_manager import get_session_manager, AWSSessionManager
-from app.models.aws import AWSSessionError, AWSProfileNotFoundError
-from app.core.security import rate_limit_default
+from app.core.security import rate_limit_sessions
+from app.core.responses import FastJSONResponse
 
 logger = logging.getLogger(__name__)
 
+
+class CredentialValidationResult(TypedDict, total=False):
+    """Credential validation result"""
+    valid: bool
+    user_id: str
+    account: str
+    arn: str
+    error: str
+    profile: str
+    region: Optional[str]
+
+
+class RefreshResult(TypedDict):
+    """Credential refresh result"""
+    success: bool
+    message: str
+    profile: str
+
+
+class RedactedCredentials(TypedDict):
+    """Assumed role credentials with secrets redacted"""
+    access_key_id: str
+    secret_access_key: str
+    session_token: str
+
+
+class AssumeRoleResult(TypedDict):
+    """Role assumption result"""
+    success: bool
+    message: str
+    role_arn: str
+    session_name: Optional[str]
+    region: str
+    expires_at: Optional[datetime]
+    credentials: RedactedCredentials
+
+
+class SessionInfoResult(TypedDict):
+    """Session manager information"""
+    session_manager: Dict[str, Any]
+    endpoints: Dict[str, str]
+    features: List[str]
+
+
+class CleanupResult(TypedDict):
+    """Session cleanup result"""
+    success: bool
+    message: str
+    cleaned_sessions: int
+    remaining_sessions: int
+
+
+# Handlers return FastJSONResponse directly, bypassing response model validation;
+# result types are declared under responses for the OpenAPI schema
 router = APIRouter(
     prefix="/api/aws/sessions",
     tags=["AWS Sessions"],
@@ -26,14 +82,15 @@ router = APIRouter(
 
 @router.get("/validate", 
            summary="Validate AWS credentials",
-           description="Validate AWS credentials for a specific profile and region")
-@rate_limit_default()
+           description="Validate AWS credentials for a specific profile and region",
+           responses={200: {"model": CredentialValidationResult}})
+@rate_limit_sessions()
 async def validate_credentials(
-    request,
+    request: Request,
     profile_name: Optional[str] = Query(None, description="AWS profile name"),
     region: Optional[str] = Query(None, description="AWS region"),
     session_manager: AWSSessionManager = Depends(get_session_manager)
-) -> Dict[str, Any]:
+) -> FastJSONResponse:
     """
     Validate AWS credentials for a profile
     
@@ -44,33 +101,26 @@ async def validate_credentials(
     Returns:
         Validation results with account information
     """
-    try:
-        result = await session_manager.validate_credentials(profile_name, region)
-        
-        if result['valid']:
-            logger.info(f"Credentials validated for profile: {profile_name}")
-        else:
-            logger.warning(f"Credential validation failed for profile: {profile_name}")
-            
-        return result
+    result = await session_manager.validate_credentials(profile_name, region)
+    
+    if result['valid']:
+        logger.info("Credentials validated for profile: %s", profile_name)
+    else:
+        logger.warning("Credential validation failed for profile: %s", profile_name)
         
-    except AWSProfileNotFoundError as e:
-        logger.error(f"Profile not found: {str(e)}")
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        logger.error(f"Credential validation error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Validation failed: {str(e)}")
+    return FastJSONResponse(result)
 
 
 @router.post("/refresh",
             summary="Refresh AWS credentials", 
-            description="Force refresh of cached credentials for a profile")
-@rate_limit_default()
+            description="Force refresh of cached credentials for a profile",
+            responses={200: {"model": RefreshResult}})
+@rate_limit_sessions()
 async def refresh_credentials(
-    request,
+    request: Request,
     profile_name: Optional[str] = Query(None, description="AWS profile name"),
     session_manager: AWSSessionManager = Depends(get_session_manager)
-) -> Dict[str, Any]:
+) -> FastJSONResponse:
     """
     Refresh cached credentials for a profile
     
@@ -80,38 +130,32 @@ async def refresh_credentials(
     Returns:
         Refresh operation result
     """
-    try:
-        success = await session_manager.refresh_credentials(profile_name)
-        
-        if success:
-            logger.info(f"Credentials refreshed for profile: {profile_name}")
-            return {
-                "success": True,
-                "message": f"Credentials refreshed for profile: {profile_name or 'default'}",
-                "profile": profile_name or 'default'
-            }
-        else:
-            logger.warning(f"Failed to refresh credentials for profile: {profile_name}")
-            return {
-                "success": False,
-                "message": f"Failed to refresh credentials for profile: {profile_name or 'default'}",
-                "profile": profile_name or 'default'
-            }
-            
-    except AWSProfileNotFoundError as e:
-        logger.error(f"Profile not found: {str(e)}")
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        logger.error(f"Credential refresh error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Refresh failed: {str(e)}")
+    success = await session_manager.refresh_credentials(profile_name)
+    profile = profile_name or 'default'
+    
+    if success:
+        logger.info("Credentials refreshed for profile: %s", profile_name)
+        return FastJSONResponse(RefreshResult(
+            success=True,
+            message=f"Credentials refreshed for profile: {profile}",
+            profile=profile
+        ))
+    else:
+        logger.warning("Failed to refresh credentials for profile: %s", profile_name)
+        return FastJSONResponse(RefreshResult(
+            success=False,
+            message=f"Failed to refresh credentials for profile: {profile}",
+            profile=profile
+        ))
 
 
 @router.post("/assume-role",
             summary="Assume IAM role",
-            description="Assume an IAM role and create a temporary session")
-@rate_limit_default()
+            description="Assume an IAM role and create a temporary session",
+            responses={200: {"model": AssumeRoleResult}})
+@rate_limit_sessions()
 async def assume_role(
-    request,
+    request: Request,
     role_arn: str = Query(..., description="IAM role ARN to assume"),
     session_name: Optional[str] = Query(None, description="Role session name"),
     duration_seconds: Optional[int] = Query(3600, description="Session duration in seconds"),
@@ -121,7 +165,7 @@ async def assume_role(
     source_profile: Optional[str] = Query(None, description="Source profile for role assumption"),
     region: Optional[str] = Query(None, description="AWS region"),
     session_manager: AWSSessionManager = Depends(get_session_manager)
-) -> Dict[str, Any]:
+) -> FastJSONResponse:
     """
     Assume an IAM role and create a temporary session
     
@@ -138,125 +182,107 @@ async def assume_role(
     Returns:
         Role assumption result
     """
-    try:
-        # Validate duration
-        if duration_seconds and (duration_seconds < 900 or duration_seconds > 43200):
-            raise HTTPException(
-                status_code=400, 
-                detail="Duration must be between 900 and 43200 seconds (15 minutes to 12 hours)"
-            )
-        
-        # Validate MFA parameters
-        if mfa_serial and not mfa_token:
-            raise HTTPException(
-                status_code=400,
-                detail="MFA token required when MFA serial is provided"
-            )
-        
-        session = await session_manager.assume_role(
-            role_arn=role_arn,
-            session_name=session_name,
-            duration_seconds=duration_seconds,
-            external_id=external_id,
-            mfa_serial=mfa_serial,
-            mfa_token=mfa_token,
-            source_profile=source_profile,
-            region=region
+    # Reject invalid parameters before any AWS work
+    if duration_seconds and not 900 <= duration_seconds <= 43200:
+        raise HTTPException(
+            status_code=400, 
+            detail="Duration must be between 900 and 43200 seconds (15 minutes to 12 hours)"
         )
-        
-        # Get credentials from session for response
-        credentials = session.get_credentials()
-        
-        logger.info(f"Successfully assumed role: {role_arn}")
-        
-        return {
-            "success": True,
-            "message": f"Successfully assumed role: {role_arn}",
-            "role_arn": role_arn,
-            "session_name": session_name,
-            "region": region or "us-east-1",
-            "expires_at": (session.get_credentials().token_expires_at if hasattr(session.get_credentials(), 'token_expires_at') else None),
-            "credentials": {
-                "access_key_id": credentials.access_key,
-                "secret_access_key": "***REDACTED***",  # Never expose secret in response
-                "session_token": "***REDACTED***"  # Never expose token in response
-            }
-        }
-        
-    except AWSSessionError as e:
-        logger.error(f"Role assumption failed: {str(e)}")
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Role assumption error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Role assumption failed: {str(e)}")
+    if mfa_serial and not mfa_token:
+        raise HTTPException(
+            status_code=400,
+            detail="MFA token required when MFA serial is provided"
+        )
+    
+    session = await session_manager.assume_role(
+        role_arn=role_arn,
+        session_name=session_name,
+        duration_seconds=duration_seconds,
+        external_id=external_id,
+        mfa_serial=mfa_serial,
+        mfa_token=mfa_token,
+        source_profile=source_profile,
+        region=region
+    )
+    
+    # Get credentials from session for response, resolving them only once
+    credentials = session.get_credentials()
+    
+    logger.info("Successfully assumed role: %s", role_arn)
+    
+    return FastJSONResponse(AssumeRoleResult(
+        success=True,
+        message=f"Successfully assumed role: {role_arn}",
+        role_arn=role_arn,
+        session_name=session_name,
+        region=region or "us-east-1",
+        expires_at=getattr(credentials, 'token_expires_at', None),
+        credentials=RedactedCredentials(
+            access_key_id=credentials.access_key,
+            secret_access_key="***REDACTED***",  # Never expose secret in response
+            session_token="***REDACTED***"  # Never expose token in response
+        )
+    ))
 
 
 @router.get("/info",
            summary="Get session manager information",
-           description="Get session manager statistics and information")
-@rate_limit_default()
+           description="Get session manager statistics and information",
+           responses={200: {"model": SessionInfoResult}})
+@rate_limit_sessions()
 async def get_session_info(
-    request,
+    request: Request,
     session_manager: AWSSessionManager = Depends(get_session_manager)
-) -> Dict[str, Any]:
+) -> FastJSONResponse:
     """
     Get session manager information and statistics
     
     Returns:
         Session manager information
     """
-    try:
-        info = session_manager.get_session_info()
-        
-        return {
-            "session_manager": info,
-            "endpoints": {
-                "validate": "/api/aws/sessions/validate",
-                "refresh": "/api/aws/sessions/refresh",
-                "assume_role": "/api/aws/sessions/assume-role",
-                "cleanup": "/api/aws/sessions/cleanup"
-            },
-            "features": [
-                "Credential validation",
-                "Session caching",
-                "Automatic credential refresh", 
-                "Role assumption",
-                "Cross-account access",
-                "Session expiration management"
-            ]
-        }
-        
-    except Exception as e:
-        logger.error(f"Failed to get session info: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to get session info: {str(e)}")
+    info = session_manager.get_session_info()
+    
+    return FastJSONResponse(SessionInfoResult(
+        session_manager=info,
+        endpoints={
+            "validate": "/api/aws/sessions/validate",
+            "refresh": "/api/aws/sessions/refresh",
+            "assume_role": "/api/aws/sessions/assume-role",
+            "cleanup": "/api/aws/sessions/cleanup"
+        },
+        features=[
+            "Credential validation",
+            "Session caching",
+            "Automatic credential refresh", 
+            "Role assumption",
+            "Cross-account access",
+            "Session expiration management"
+        ]
+    ))
 
 
 @router.post("/cleanup",
             summary="Clean up expired sessions",
-            description="Manually trigger cleanup of expired sessions")
-@rate_limit_default()
+            description="Manually trigger cleanup of expired sessions",
+            responses={200: {"model": CleanupResult}})
+@rate_limit_sessions()
 async def cleanup_sessions(
-    request,
+    request: Request,
     session_manager: AWSSessionManager = Depends(get_session_manager)
-) -> Dict[str, Any]:
+) -> FastJSONResponse:
     """
     Manually trigger cleanup of expired sessions
     
     Returns:
         Cleanup operation result
     """
-    try:
-        cleaned_count = session_manager.cleanup_expired_sessions()
-        
-        logger.info(f"Session cleanup completed: {cleaned_count} sessions removed")
-        
-        return {
-            "success": True,
-            "message": "Session cleanup completed",
-            "cleaned_sessions": cleaned_count,
-            "remaining_sessions": session_manager.session_cache.active_session_count
-        }
-        
-    except Exception as e:
-        logger.error(f"Session cleanup error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Cleanup failed: {str(e)}")
+    cleaned_count = session_manager.cleanup_expired_sessions()
+    
+    logger.info("Session cleanup completed: %s sessions removed", cleaned_count)
+    
+    return FastJSONResponse(CleanupResult(
+        success=True,
+        message="Session cleanup completed",
+        cleaned_sessions=cleaned_count,
+        remaining_sessions=session_manager.session_cache.active_session_count
+    ))
@@ -1,15 +1,37 @@
 """
 Health check endpoints
 """
-from typing import Dict, Any
+import time
 from datetime import datetime, timezone
+from typing import Tuple
 
 from fastapi import APIRouter, status, Request
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
+from pydantic_core import to_json
 
 from app.core.config import settings
-from app.core.security import rate_limit_health
-from app.models.responses import ErrorResponse
+from app.core.security import rate_limit_exempt, rate_limit_health
+from app.models.responses import ErrorResponse, ApiInfo, ConfigurationSummary
+
+# Settings are fixed at startup, so the static parts of health responses are built once
+_ENVIRONMENT = "development" if settings.DEBUG else "production"
+_VERSION = settings.VERSION
+_DETAILED_HEALTH_STATIC = {
+    "version": _VERSION,
+    "environment": _ENVIRONMENT,
+    "api": ApiInfo(
+        name=settings.PROJECT_NAME,
+        version=_VERSION,
+        docs_url="/docs",
+        redoc_url="/redoc"
+    ),
+    "configuration": ConfigurationSummary(
+        debug=settings.DEBUG,
+        aws_default_region=settings.AWS_DEFAULT_REGION,
+        cors_origins=settings.cors_origins_list
+    )
+}
 
 
 class HealthResponse(BaseModel):
@@ -36,8 +58,8 @@ class DetailedHealthResponse(BaseModel):
     timestamp: str = Field(..., description="ISO formatted timestamp")
     version: str = Field(..., description="API version")
     environment: str = Field(..., description="Current environment")
-    api: Dict[str, Any] = Field(..., description="API information")
-    configuration: Dict[str, Any] = Field(..., description="Configuration summary")
+    api: ApiInfo = Field(..., description="API information")
+    configuration: ConfigurationSummary = Field(..., description="Configuration summary")
     
     class Config:
         json_schema_extra = {
@@ -61,12 +83,42 @@ class DetailedHealthResponse(BaseModel):
         }
 
 
+# Basic health response body around the timestamp, serialized once
+_HEALTH_BODY_PREFIX = b'{"status":"healthy","timestamp":"'
+_HEALTH_BODY_SUFFIX = (
+    b'","version":' + to_json(_VERSION) + b',"environment":' + to_json(_ENVIRONMENT) + b"}"
+)
+
+# Health timestamps have second resolution, so they are formatted once per second:
+# (epoch second, ISO 8601 timestamp, basic health response body)
+_timestamp_cache: Tuple[int, str, bytes] = (0, "", b"")
+
+
+def _get_health_timestamp() -> Tuple[str, bytes]:
+    """
+    Get the current health check timestamp, reformatted at most once per second
+    
+    Returns:
+        Tuple of (ISO 8601 timestamp, basic health response body)
+    """
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        moment = datetime.fromtimestamp(now, timezone.utc)
+        basic_timestamp = moment.strftime("%Y-%m-%dT%H:%M:%SZ").encode()
+        _timestamp_cache = (
+            now,
+            moment.isoformat(),
+            _HEALTH_BODY_PREFIX + basic_timestamp + _HEALTH_BODY_SUFFIX
+        )
+    return _timestamp_cache[1], _timestamp_cache[2]
+
+
 router = APIRouter()
 
 
 @router.get(
     "/health",
-    response_model=HealthResponse,
     status_code=status.HTTP_200_OK,
     summary="Basic Health Check",
     description="Returns the basic health status of the API",
@@ -76,33 +128,26 @@ router = APIRouter()
             "description": "API is healthy and responding",
             "model": HealthResponse,
         },
-        429: {
-            "description": "Rate limit exceeded",
-            "model": ErrorResponse,
-        },
         503: {
             "description": "API is unhealthy or experiencing issues",
             "model": ErrorResponse,
         },
     },
 )
-@rate_limit_health()
-async def health_check(request: Request) -> HealthResponse:
+@rate_limit_exempt()
+async def health_check(request: Request) -> Response:
     """
     Basic health check endpoint to verify API is operational.
     
     This endpoint provides a quick way to verify that the API is running and responsive.
     It returns basic information about the service status, version, and environment.
+    It is not rate limited, so load balancer and orchestrator probes never see a 429.
     
     Returns:
-        HealthResponse: Basic health status information
+        JSON response matching HealthResponse
     """
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.now(timezone.utc),
-        version=settings.VERSION,
-        environment="development" if settings.DEBUG else "production"
-    )
+    # Serialized directly, skipping model construction and response validation
+    return Response(content=_get_health_timestamp()[1], media_type="application/json")
 
 
 @router.get(
@@ -140,18 +185,6 @@ async def detailed_health_check(request: Request) -> DetailedHealthResponse:
     """
     return DetailedHealthResponse(
         status="healthy",
-        timestamp=datetime.now(timezone.utc).isoformat(),
-        version=settings.VERSION,
-        environment="development" if settings.DEBUG else "production",
-        api={
-            "name": settings.PROJECT_NAME,
-            "version": settings.VERSION,
-            "docs_url": "/docs",
-            "redoc_url": "/redoc"
-        },
-        configuration={
-            "debug": settings.DEBUG,
-            "aws_default_region": settings.AWS_DEFAULT_REGION,
-            "cors_origins": settings.CORS_ORIGINS
-        }
+        timestamp=_get_health_timestamp()[0],
+        **_DETAILED_HEALTH_STATIC
     )
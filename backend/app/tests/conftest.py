@@ -9,10 +9,11 @@ from fastapi.testclient import TestClient
 from main import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """FastAPI test client fixture"""
-    return TestClient(app)
+    """FastAPI test client fixture, with the app lifespan entered once per test session"""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture
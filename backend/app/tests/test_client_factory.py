@@ -0,0 +1,50 @@
+"""
+Test AWS service client factory caching
+"""
+from unittest.mock import AsyncMock, MagicMock
+
+import boto3
+import pytest
+
+from app.aws.client_factory import AWSServiceClientFactory
+from app.routers.accounts import PERMISSION_PROBE_CONFIG
+
+
+@pytest.fixture
+def client_factory():
+    """Client factory whose sessions use static placeholder credentials, so no AWS calls are made"""
+    session = boto3.Session(
+        aws_access_key_id="AKIAEXAMPLEKEY000001",
+        aws_secret_access_key="example-secret",
+        region_name="us-east-1"
+    )
+    session_manager = MagicMock()
+    session_manager.get_session = AsyncMock(return_value=session)
+    session_manager.create_client = lambda session, service_name, **kwargs: session.client(service_name, **kwargs)
+    return AWSServiceClientFactory(session_manager=session_manager)
+
+
+@pytest.mark.asyncio
+async def test_probe_clients_keep_probe_config(client_factory: AWSServiceClientFactory):
+    """Test permission probe clients are not served from the default client cache"""
+    default_client = await client_factory.get_client("iam", "default", "us-east-1")
+
+    probe_clients = await client_factory.get_clients(
+        ["iam"], "default", "us-east-1", config=PERMISSION_PROBE_CONFIG
+    )
+    probe_client = probe_clients["iam"]
+
+    assert probe_client is not default_client
+    assert probe_client.meta.config.read_timeout == PERMISSION_PROBE_CONFIG.read_timeout
+    assert probe_client.meta.config.connect_timeout == PERMISSION_PROBE_CONFIG.connect_timeout
+
+
+@pytest.mark.asyncio
+async def test_default_clients_keep_default_config(client_factory: AWSServiceClientFactory):
+    """Test default clients are not served from the permission probe client cache"""
+    await client_factory.get_clients(["iam"], "default", "us-east-1", config=PERMISSION_PROBE_CONFIG)
+
+    default_client = await client_factory.get_client("iam", "default", "us-east-1")
+
+    assert default_client.meta.config.read_timeout == client_factory.default_config.read_timeout
+    assert client_factory.peek_client("iam", "default", "us-east-1") is default_client
@@ -1,46 +1,94 @@
 """
 Cloud Explorer Backend - Main FastAPI Application
 """
+import gzip
 import logging
 import asyncio
+import inspect
 from contextlib import asynccontextmanager
+from typing import Iterable, Iterator, List, Optional, Tuple
 
-from fastapi import FastAPI, status, Request
+from anyio import to_thread
+
+from fastapi import APIRouter, FastAPI, status, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 from fastapi.openapi.utils import get_openapi
+from pydantic_core import to_json
 
 from app.core.config import settings
+from app.core.cache import compute_etag, is_not_modified
 from app.core.validation import validate_configuration, setup_logging
 from app.core.security import (
     SecurityHeadersMiddleware, 
+    FastTrustedHostMiddleware,
     RequestLoggingMiddleware, 
+    REQUEST_LOG_QUEUE_SIZE,
+    drain_request_log,
     setup_rate_limiting,
     rate_limit_default,
     rate_limit_config
 )
 from app.core.ssl_utils import get_ssl_context
+from app.core.responses import FastJSONResponse
+from app.core.routing import DirectAPIRoute
 from app.routers import health, aws_profiles, aws_sessions, aws_clients, accounts
 from app.models.responses import RootResponse, ConfigResponse, ErrorResponse
-from app.aws.session_manager import cleanup_sessions_periodically
-from app.aws.client_factory import cleanup_clients_periodically
+from app.models.aws import AWSProfileNotFoundError, AWSRoleAssumptionError, AWSSessionError
+from app.aws.session_manager import cleanup_sessions_periodically, prefetch_sessions_periodically
+from app.aws.client_factory import AWSServiceType, cleanup_clients_periodically, get_client_factory_instance
 
 
 # Setup logging
 setup_logging(settings)
 logger = logging.getLogger(__name__)
 
+# Settings-derived values, resolved once since settings do not change after startup
+IS_DEV = settings.is_development
+ENV_NAME = "development" if IS_DEV else "production"
+DOCS_URL = "/docs" if settings.ENABLE_OPENAPI_DOCS else None
+ENABLED_SERVICES = tuple(settings.enabled_services)
+CORS_ORIGINS = tuple(settings.cors_origins_list)
+ALLOWED_HOSTS = tuple(settings.allowed_hosts_list)
+
+# Worker threads for sync endpoints and dependencies. All endpoints are async
+# and blocking AWS calls use asyncio's executor, so few threads are needed
+THREADPOOL_SIZE = 4
+
+# Seconds a forked worker gets to finish in-flight requests on shutdown
+WORKER_SHUTDOWN_TIMEOUT_SECONDS = 30
+
+# A forked worker that exits within WORKER_MIN_UPTIME_SECONDS of starting counts
+# as a startup failure. Its restart is delayed by a backoff that doubles with
+# each consecutive failure, and the server exits after WORKER_MAX_STARTUP_FAILURES
+WORKER_MIN_UPTIME_SECONDS = 5
+WORKER_RESTART_BACKOFF_SECONDS = 1
+WORKER_RESTART_MAX_BACKOFF_SECONDS = 30
+WORKER_MAX_STARTUP_FAILURES = 5
+
 # Background tasks
 cleanup_task = None
 client_cleanup_task = None
+session_prefetch_task = None
+request_log_task = None
+
+
+def _iter_endpoints(routes: Iterable) -> Iterator:
+    """Yield route endpoints, descending into included routers"""
+    for route in routes:
+        included_router = getattr(route, "original_router", None)
+        if included_router is not None:
+            yield from _iter_endpoints(included_router.routes)
+        elif getattr(route, "endpoint", None) is not None:
+            yield route.endpoint
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler"""
-    global cleanup_task, client_cleanup_task
+    global cleanup_task, client_cleanup_task, session_prefetch_task, request_log_task
     
     # Startup
     logger.info("Starting Cloud Explorer API...")
@@ -50,13 +98,39 @@ async def lifespan(app: FastAPI):
         logger.error("Configuration validation failed")
         raise SystemExit(1)
     
-    logger.info(f"Environment: {'development' if settings.is_development else 'production'}")
-    logger.info(f"Enabled services: {', '.join(settings.enabled_services)}")
-    logger.info(f"API documentation: {'/docs' if settings.ENABLE_OPENAPI_DOCS else 'disabled'}")
+    logger.info("Environment: %s", ENV_NAME)
+    logger.info("Enabled services: %s", ", ".join(ENABLED_SERVICES))
+    logger.info("API documentation: %s", DOCS_URL or "disabled")
+    
+    # Load region metadata for supported services so availability checks are table lookups
+    try:
+        await asyncio.to_thread(
+            get_client_factory_instance().warm_service_region_table,
+            {service.value for service in AWSServiceType}
+        )
+    except Exception as e:
+        logger.warning("Could not preload service region table: %s", e)
+    
+    # Keep endpoints off Starlette's thread pool, which is sized for occasional use
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    for endpoint in _iter_endpoints(app.routes):
+        if not inspect.iscoroutinefunction(endpoint):
+            logger.warning(
+                "Endpoint %s.%s is not async and will run on the %d-thread pool",
+                endpoint.__module__, endpoint.__qualname__, THREADPOOL_SIZE
+            )
+    
+    # Build and encode the OpenAPI schema now rather than on the first docs request
+    _get_openapi_document()
+    
+    # Write security log entries from a background task, off the request path
+    app.state.request_log_queue = asyncio.Queue(maxsize=REQUEST_LOG_QUEUE_SIZE)
+    request_log_task = asyncio.create_task(drain_request_log(app.state.request_log_queue))
     
     # Start background cleanup tasks
     cleanup_task = asyncio.create_task(cleanup_sessions_periodically())
     client_cleanup_task = asyncio.create_task(cleanup_clients_periodically())
+    session_prefetch_task = asyncio.create_task(prefetch_sessions_periodically())
     logger.info("AWS session and client cleanup tasks started")
     
     yield
@@ -64,16 +138,24 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down Cloud Explorer API...")
     
+    # Log any later requests directly, so no entries are left in the queue
+    app.state.request_log_queue = None
+    
     # Cancel background tasks
-    for task, name in [(cleanup_task, "session cleanup"), (client_cleanup_task, "client cleanup")]:
+    for task, name in [
+        (cleanup_task, "session cleanup"),
+        (client_cleanup_task, "client cleanup"),
+        (session_prefetch_task, "session prefetch"),
+        (request_log_task, "request log"),
+    ]:
         if task:
             task.cancel()
             try:
                 await task
             except asyncio.CancelledError:
-                logger.info(f"{name.title()} task cancelled")
+                logger.info("%s task cancelled", name.title())
             except Exception as e:
-                logger.error(f"Error stopping {name} task: {str(e)}")
+                logger.error("Error stopping %s task: %s", name, e)
 
 
 # Create FastAPI application
@@ -81,9 +163,10 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     description=settings.DESCRIPTION,
     version=settings.VERSION,
-    docs_url="/docs" if settings.ENABLE_OPENAPI_DOCS else None,
+    docs_url=DOCS_URL,
     redoc_url="/redoc" if settings.ENABLE_OPENAPI_DOCS else None,
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     contact={
         "name": "Cloud Explorer Team",
         "url": "https://github.com/PrasadTelasula/cloud-explorer",
@@ -151,10 +234,18 @@ app = FastAPI(
     ],
 )
 
+# Response compression for larger payloads such as account listings. Added
+# first so it is innermost and sees complete response bodies; outside of
+# the streaming logging middleware it would compress every response.
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=1000,
+)
+
 # Security middleware
 app.add_middleware(
-    TrustedHostMiddleware,
-    allowed_hosts=settings.allowed_hosts_list,
+    FastTrustedHostMiddleware,
+    allowed_hosts=ALLOWED_HOSTS,
 )
 
 # Security headers middleware
@@ -171,10 +262,12 @@ app.add_middleware(
 # CORS middleware (configured for security)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
+    # Explicit list so preflight responses use Starlette's precomputed header
+    # value; If-None-Match lets clients revalidate ETag-cached responses
+    allow_headers=["Authorization", "Content-Type", "If-None-Match", "X-API-Key", "X-Requested-With"],
     expose_headers=["X-Process-Time"],
     max_age=600,  # Cache preflight requests for 10 minutes
 )
@@ -182,14 +275,62 @@ app.add_middleware(
 # Setup rate limiting
 rate_limiter = setup_rate_limiting(app)
 
+
+# AWS errors raised by route handlers are mapped to HTTP responses here,
+# so handlers do not need their own try/except blocks
+@app.exception_handler(AWSProfileNotFoundError)
+async def aws_profile_not_found_handler(request: Request, exc: AWSProfileNotFoundError) -> FastJSONResponse:
+    """Return 404 when a requested AWS profile does not exist"""
+    logger.error("Profile not found: %s", exc)
+    return FastJSONResponse(status_code=status.HTTP_404_NOT_FOUND, content={"detail": str(exc)})
+
+
+@app.exception_handler(AWSRoleAssumptionError)
+async def aws_role_assumption_error_handler(request: Request, exc: AWSRoleAssumptionError) -> FastJSONResponse:
+    """Return 400 when a requested role cannot be assumed"""
+    logger.error("Role assumption error: %s", exc)
+    return FastJSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(exc)})
+
+
+@app.exception_handler(AWSSessionError)
+async def aws_session_error_handler(request: Request, exc: AWSSessionError) -> FastJSONResponse:
+    """Return 500 with the error detail when AWS session or service client setup fails"""
+    logger.error("AWS session error: %s", exc)
+    return FastJSONResponse(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, content={"detail": str(exc)})
+
+
 # Include routers
 app.include_router(health.router, prefix="/api", tags=["health"])
 app.include_router(aws_profiles.router, prefix="/api/aws", tags=["aws-profiles"])
-app.include_router(aws_sessions.router, tags=["aws-sessions"])
+# Session management is only useful when at least one AWS service is enabled;
+# skipping it keeps the route table short for health-only deployments
+if ENABLED_SERVICES:
+    app.include_router(aws_sessions.router, tags=["aws-sessions"])
 app.include_router(aws_clients.router, tags=["aws-clients"])
 app.include_router(accounts.router, tags=["accounts"])
 
 
+# Error responses documented on every operation
+GLOBAL_ERROR_RESPONSES = {
+    "400": {
+        "description": "Bad Request",
+        "content": {
+            "application/json": {
+                "schema": {"$ref": "#/components/schemas/ErrorResponse"}
+            }
+        },
+    },
+    "500": {
+        "description": "Internal Server Error",
+        "content": {
+            "application/json": {
+                "schema": {"$ref": "#/components/schemas/ErrorResponse"}
+            }
+        },
+    },
+}
+
+
 def custom_openapi():
     """Custom OpenAPI schema generator with enhanced documentation"""
     if app.openapi_schema:
@@ -227,15 +368,8 @@ def custom_openapi():
         Check the error message and detail fields for troubleshooting information.
         """,
         routes=app.routes,
-        contact={
-            "name": "Cloud Explorer Team",
-            "url": "https://github.com/PrasadTelasula/cloud-explorer",
-            "email": "support@cloudexplorer.dev",
-        },
-        license_info={
-            "name": "MIT",
-            "url": "https://opensource.org/licenses/MIT",
-        },
+        contact=app.contact,
+        license_info=app.license_info,
     )
     
     # Add security schemes for future authentication
@@ -254,28 +388,11 @@ def custom_openapi():
         },
     }
     
-    # Add global error responses
-    for path in openapi_schema["paths"]:
-        for method in openapi_schema["paths"][path]:
+    # Add global error responses, sharing one definition across operations
+    for path_item in openapi_schema["paths"].values():
+        for method, operation in path_item.items():
             if method != "parameters":
-                openapi_schema["paths"][path][method]["responses"].update({
-                    "400": {
-                        "description": "Bad Request",
-                        "content": {
-                            "application/json": {
-                                "schema": {"$ref": "#/components/schemas/ErrorResponse"}
-                            }
-                        },
-                    },
-                    "500": {
-                        "description": "Internal Server Error",
-                        "content": {
-                            "application/json": {
-                                "schema": {"$ref": "#/components/schemas/ErrorResponse"}
-                            }
-                        },
-                    },
-                })
+                operation["responses"].update(GLOBAL_ERROR_RESPONSES)
     
     app.openapi_schema = openapi_schema
     return app.openapi_schema
@@ -283,10 +400,84 @@ def custom_openapi():
 
 app.openapi = custom_openapi
 
+# OpenAPI document as (JSON body, gzip-compressed body, ETag), encoded once
+_openapi_document: Optional[Tuple[bytes, bytes, str]] = None
+
+
+def _get_openapi_document() -> Tuple[bytes, bytes, str]:
+    """Get the encoded OpenAPI document, encoding it on first use"""
+    global _openapi_document
+    if _openapi_document is None:
+        body = to_json(app.openapi())
+        _openapi_document = (body, gzip.compress(body, 6), compute_etag(body))
+    return _openapi_document
+
+
+async def openapi_json(request: Request) -> Response:
+    """
+    Serve the OpenAPI document from its pre-encoded bytes
+    
+    Clients accepting gzip get the pre-compressed body, which the gzip
+    middleware passes through untouched, and can revalidate with the ETag.
+    """
+    body, compressed_body, etag = _get_openapi_document()
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        body = compressed_body
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# Replace FastAPI's OpenAPI route, which serializes the schema on every request
+app.router.routes[:] = [
+    route for route in app.router.routes if getattr(route, "path", None) != app.openapi_url
+]
+app.add_route(app.openapi_url, openapi_json, include_in_schema=False)
+
+
+def _encode_root_response() -> bytes:
+    """Encode the root endpoint response body from settings"""
+    return RootResponse(
+        message=settings.PROJECT_NAME,
+        version=settings.VERSION,
+        description=settings.DESCRIPTION,
+        environment=ENV_NAME,
+        docs=DOCS_URL,
+        health="/api/health",
+        enabled_services=ENABLED_SERVICES
+    ).model_dump_json().encode()
+
+
+def _encode_config_response() -> bytes:
+    """Encode the configuration endpoint response body from settings"""
+    config_dict = settings.to_dict()
+    return ConfigResponse(
+        project_name=config_dict.get("PROJECT_NAME", ""),
+        version=config_dict.get("VERSION", ""),
+        debug=config_dict.get("DEBUG", False),
+        environment=ENV_NAME,
+        aws_region=config_dict.get("AWS_DEFAULT_REGION", ""),
+        enabled_services=ENABLED_SERVICES,
+        cors_origins=CORS_ORIGINS,
+        log_level=config_dict.get("LOG_LEVEL", "")
+    ).model_dump_json().encode()
 
-@app.get(
+
+# Root and config responses depend only on settings, so they are encoded once per process
+ROOT_RESPONSE_BODY = _encode_root_response()
+CONFIG_RESPONSE_BODY = _encode_config_response() if IS_DEV else None
+CONFIG_UNAVAILABLE_BODY = b'{"error":"Configuration endpoint only available in development"}'
+
+# Root and config endpoints only return the bodies above, so their routes call
+# the endpoint directly instead of going through dependency resolution
+root_router = APIRouter(route_class=DirectAPIRoute)
+
+
+@root_router.get(
     "/",
-    response_model=RootResponse,
     status_code=status.HTTP_200_OK,
     summary="API Information",
     description="Get basic information about the Cloud Explorer API including version, documentation links, and enabled services",
@@ -303,7 +494,7 @@ app.openapi = custom_openapi
     },
 )
 @rate_limit_default()
-async def root(request: Request) -> RootResponse:
+async def root(request: Request) -> Response:
     """
     Root endpoint providing API information and navigation links.
     
@@ -311,22 +502,13 @@ async def root(request: Request) -> RootResponse:
     about the service including version, documentation links, and available features.
     
     Returns:
-        RootResponse: Complete API information including navigation links
+        JSON response matching RootResponse, from the body encoded at import
     """
-    return RootResponse(
-        message=settings.PROJECT_NAME,
-        version=settings.VERSION,
-        description=settings.DESCRIPTION,
-        environment="development" if settings.is_development else "production",
-        docs="/docs" if settings.ENABLE_OPENAPI_DOCS else None,
-        health="/api/health",
-        enabled_services=settings.enabled_services
-    )
+    return Response(content=ROOT_RESPONSE_BODY, media_type="application/json")
 
 
-@app.get(
+@root_router.get(
     "/config",
-    response_model=ConfigResponse,
     status_code=status.HTTP_200_OK,
     summary="Configuration Information",
     description="Get non-sensitive configuration information (development only)",
@@ -347,7 +529,7 @@ async def root(request: Request) -> RootResponse:
     },
 )
 @rate_limit_config()
-async def get_config(request: Request) -> ConfigResponse:
+async def get_config(request: Request) -> Response:
     """
     Get non-sensitive configuration information.
     
@@ -355,38 +537,38 @@ async def get_config(request: Request) -> ConfigResponse:
     the current configuration settings without exposing sensitive information.
     
     Returns:
-        ConfigResponse: Current configuration settings
+        JSON response matching ConfigResponse, from the body encoded at import
         
     Raises:
         HTTPException: 404 if called in production environment
     """
-    if not settings.is_development:
-        return JSONResponse(
-            {"error": "Configuration endpoint only available in development"},
-            status_code=404
+    if not IS_DEV:
+        return Response(
+            content=CONFIG_UNAVAILABLE_BODY,
+            status_code=status.HTTP_404_NOT_FOUND,
+            media_type="application/json"
         )
     
-    config_dict = settings.to_dict()
-    return ConfigResponse(
-        project_name=config_dict.get("PROJECT_NAME", ""),
-        version=config_dict.get("VERSION", ""),
-        debug=config_dict.get("DEBUG", False),
-        environment="development" if settings.is_development else "production",
-        aws_region=config_dict.get("AWS_DEFAULT_REGION", ""),
-        enabled_services=settings.enabled_services,
-        cors_origins=settings.cors_origins_list,
-        log_level=config_dict.get("LOG_LEVEL", "")
-    )
+    return Response(content=CONFIG_RESPONSE_BODY, media_type="application/json")
+
+
+app.include_router(root_router)
 
 
 if __name__ == "__main__":
+    import multiprocessing
+    import multiprocessing.connection
+    import signal
+    import sys
+    import time
+    
     import uvicorn
     
     # Get SSL context for HTTPS if enabled
     ssl_context = get_ssl_context()
     
     # Hot-reload configuration in development
-    reload_dirs = ["./app"] if settings.is_development else None
+    reload_dirs = ["./app"] if IS_DEV else None
     
     # Configure server parameters
     server_config = {
@@ -397,7 +579,17 @@ if __name__ == "__main__":
         "reload_dirs": reload_dirs,
         "workers": settings.WORKERS if not settings.RELOAD else 1,
         "log_level": settings.LOG_LEVEL.lower(),
-        "access_log": settings.is_development,
+        "access_log": IS_DEV,
+        # uvloop and httptools ship with uvicorn[standard]; pin them rather than
+        # relying on "auto", which silently falls back to asyncio and h11
+        "loop": "uvloop",
+        "http": "httptools",
+        # The API exposes no WebSocket endpoints
+        "ws": "none",
+        # Keep idle connections open across frontend polling intervals and
+        # queue more pending connections during bursts
+        "timeout_keep_alive": 30,
+        "backlog": 2048,
     }
     
     # Add SSL configuration if HTTPS is enabled
@@ -417,4 +609,108 @@ if __name__ == "__main__":
     if settings.RATE_LIMITING_ENABLED:
         print(f"Rate limiting: {settings.RATE_LIMIT_REQUESTS} requests/minute")
     
-    uvicorn.run(**server_config)
+    workers = server_config["workers"]
+    if workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+        # Fork workers from this already-initialized process: they share one
+        # listening socket and inherit the imported app, settings and warmed
+        # caches instead of re-importing everything as spawned workers would
+        worker_options = {
+            key: value for key, value in server_config.items()
+            if key not in ("app", "reload", "reload_dirs", "workers")
+        }
+        config = uvicorn.Config(app, **worker_options)
+        sockets = [config.bind_socket()]
+        
+        def run_worker() -> None:
+            """Serve requests on the shared socket until interrupted"""
+            # Drop the supervisor's handlers inherited through fork
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            try:
+                uvicorn.Server(config).run(sockets=sockets)
+            except KeyboardInterrupt:
+                pass
+        
+        fork_context = multiprocessing.get_context("fork")
+        
+        # Per worker slot: the running process (None while a restart is pending),
+        # when it started, its consecutive startup failures and when to restart it
+        processes: List[Optional[multiprocessing.Process]] = [None] * workers
+        started_at = [0.0] * workers
+        startup_failures = [0] * workers
+        restart_at = [0.0] * workers
+        
+        def start_worker(index: int) -> None:
+            """Fork a worker process serving the shared socket into a slot"""
+            process = fork_context.Process(target=run_worker)
+            process.start()
+            processes[index] = process
+            started_at[index] = time.monotonic()
+        
+        shutdown_signals = []
+        exit_code = 0
+        
+        def request_shutdown(signum: int, frame) -> None:
+            """Stop restarting workers and let the supervisor shut them down"""
+            shutdown_signals.append(signum)
+        
+        for index in range(workers):
+            start_worker(index)
+        signal.signal(signal.SIGINT, request_shutdown)
+        signal.signal(signal.SIGTERM, request_shutdown)
+        
+        # Supervise until SIGINT or SIGTERM, replacing workers that exit and
+        # backing off on workers that keep failing at startup
+        while not shutdown_signals and not exit_code:
+            multiprocessing.connection.wait(
+                [process.sentinel for process in processes if process is not None], timeout=0.5
+            )
+            now = time.monotonic()
+            for index, process in enumerate(processes):
+                if shutdown_signals or exit_code:
+                    break
+                
+                if process is not None and not process.is_alive():
+                    process.join()
+                    processes[index] = None
+                    if now - started_at[index] < WORKER_MIN_UPTIME_SECONDS:
+                        startup_failures[index] += 1
+                    else:
+                        startup_failures[index] = 0
+                    
+                    if startup_failures[index] >= WORKER_MAX_STARTUP_FAILURES:
+                        logger.error(
+                            "Worker %s exited with code %s, %s times in a row within %ss of starting; stopping server",
+                            process.pid, process.exitcode, startup_failures[index], WORKER_MIN_UPTIME_SECONDS
+                        )
+                        exit_code = 1
+                        break
+                    
+                    delay = 0 if not startup_failures[index] else min(
+                        WORKER_RESTART_BACKOFF_SECONDS * 2 ** (startup_failures[index] - 1),
+                        WORKER_RESTART_MAX_BACKOFF_SECONDS
+                    )
+                    logger.warning(
+                        "Worker %s exited with code %s, restarting in %ss", process.pid, process.exitcode, delay
+                    )
+                    restart_at[index] = now + delay
+                
+                if processes[index] is None and now >= restart_at[index]:
+                    start_worker(index)
+        
+        # Ask every worker to shut down gracefully and reap it, killing any
+        # worker that does not stop in time
+        running = [process for process in processes if process is not None]
+        for process in running:
+            if process.is_alive():
+                process.terminate()
+        for process in running:
+            process.join(WORKER_SHUTDOWN_TIMEOUT_SECONDS)
+            if process.is_alive():
+                logger.warning("Worker %s did not stop in time, killing it", process.pid)
+                process.kill()
+                process.join()
+        
+        sys.exit(exit_code)
+    else:
+        uvicorn.run(**server_config)
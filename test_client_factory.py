@@ -6,10 +6,15 @@ This script demonstrates and tests the AWS Client Factory functionality
 including service clients, regional management, and caching.
 """
 import asyncio
+import os
 import sys
+import traceback
 import json
+from itertools import product
 from pathlib import Path
 
+from botocore.exceptions import BotoCoreError, ClientError
+
 # Add the backend directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "backend"))
 
@@ -17,44 +22,77 @@ from app.aws.client_factory import AWSServiceClientFactory, AWSServiceType, AWSS
 from app.aws.session_manager import AWSSessionManager
 from app.models.aws import AWSSessionError, AWSProfileNotFoundError
 
+# Full tracebacks are only printed when CE_TEST_VERBOSE is set
+VERBOSE = bool(os.environ.get("CE_TEST_VERBOSE"))
+
+# Service types listed by test_service_types, grouped by category
+SERVICE_CATEGORIES = (
+    ("Compute", (AWSServiceType.EC2, AWSServiceType.LAMBDA, AWSServiceType.ECS)),
+    ("Storage", (AWSServiceType.S3, AWSServiceType.EBS, AWSServiceType.EFS)),
+    ("Database", (AWSServiceType.RDS, AWSServiceType.DYNAMODB)),
+    ("Security", (AWSServiceType.IAM, AWSServiceType.STS, AWSServiceType.KMS))
+)
+
+# Clients used by the client tests for the default profile, as (region, services)
+CLIENT_WARMUP = (
+    ("us-east-1", ("s3", "ec2", "sts")),
+    ("us-west-2", ("sts",)),
+    ("eu-west-1", ("sts",))
+)
+
 
-async def test_client_factory():
+async def test_client_factory(client_factory: AWSServiceClientFactory):
     """Test AWS Client Factory functionality"""
     print("🏭 Testing AWS Client Factory...")
     print("=" * 60)
     
-    # Initialize client factory
-    client_factory = AWSServiceClientFactory()
-    
     try:
         # Test 1: Get client factory info
         print("\n📊 Client Factory Information:")
         stats = client_factory.get_cache_stats()
-        print(json.dumps(stats, indent=2))
+        print(f"  {stats}")
         
         # Test 2: Test service availability checking
         print("\n🌍 Testing Service Availability:")
         test_services = ['s3', 'ec2', 'lambda', 'rds']
         test_regions = ['us-east-1', 'eu-west-1', 'ap-southeast-1']
         
-        for service in test_services:
-            print(f"\n  Service: {service}")
-            for region in test_regions:
-                try:
-                    availability = await client_factory.check_service_availability(service, region)
-                    print(f"    {region}: {availability.value}")
-                except Exception as e:
-                    print(f"    {region}: Error - {str(e)}")
+        async def check_availability(service, region):
+            try:
+                return service, region, await client_factory.check_service_availability(service, region)
+            except Exception as e:
+                return service, region, e
+        
+        # Print each result as soon as its check finishes
+        for next_check in asyncio.as_completed([
+            check_availability(service, region) for service, region in product(test_services, test_regions)
+        ]):
+            service, region, availability = await next_check
+            if isinstance(availability, Exception):
+                print(f"  {service} in {region}: Error - {str(availability)}")
+            else:
+                print(f"  {service} in {region}: {availability.value}")
         
         # Test 3: Get available regions for services
         print("\n📍 Available Regions for Services:")
         for service in ['s3', 'ec2', 'lambda'][:2]:  # Test first 2
             try:
                 regions = await client_factory.get_available_regions(service)
-                print(f"  {service}: {len(regions)} regions - {regions[:5]}{'...' if len(regions) > 5 else ''}")
+                region_count = len(regions)
+                print(f"  {service}: {region_count} regions - {regions[:5]}{'...' if region_count > 5 else ''}")
             except Exception as e:
                 print(f"  {service}: Error - {str(e)}")
         
+        # Create every client the tests below use at once, one session per
+        # region; failures are reported by the individual tests
+        print("\n🔥 Warming Client Cache:")
+        warmup_results = await asyncio.gather(
+            *(client_factory.get_clients(list(services), "default", region) for region, services in CLIENT_WARMUP),
+            return_exceptions=True
+        )
+        warmed_count = sum(len(clients) for clients in warmup_results if not isinstance(clients, Exception))
+        print(f"  ✅ Warmed {warmed_count} clients")
+        
         # Test 4: Create S3 client (most likely to work)
         print("\n🪣 Testing S3 Client Creation:")
         try:
@@ -68,13 +106,13 @@ async def test_client_factory():
             # Test the client with a list buckets call
             print("  🧪 Testing S3 client with list_buckets:")
             try:
-                response = s3_client.list_buckets()
+                response = await client_factory.call(s3_client, 'list_buckets')
                 bucket_count = len(response.get('Buckets', []))
                 print(f"  ✅ Found {bucket_count} S3 buckets")
-            except Exception as e:
+            except (ClientError, BotoCoreError) as e:
                 print(f"  ⚠️  S3 list_buckets failed (may be expected): {str(e)}")
                 
-        except Exception as e:
+        except AWSServiceError as e:
             print(f"  ❌ S3 client creation failed: {str(e)}")
         
         # Test 5: Create EC2 client
@@ -90,13 +128,13 @@ async def test_client_factory():
             # Test the client with describe regions
             print("  🧪 Testing EC2 client with describe_regions:")
             try:
-                response = ec2_client.describe_regions(MaxResults=5)
+                response = await client_factory.call(ec2_client, 'describe_regions', MaxResults=5)
                 region_count = len(response.get('Regions', []))
                 print(f"  ✅ Found {region_count} regions")
-            except Exception as e:
+            except (ClientError, BotoCoreError) as e:
                 print(f"  ⚠️  EC2 describe_regions failed (may be expected): {str(e)}")
                 
-        except Exception as e:
+        except AWSServiceError as e:
             print(f"  ❌ EC2 client creation failed: {str(e)}")
         
         # Test 6: Test client caching
@@ -114,32 +152,46 @@ async def test_client_factory():
             stats_after = client_factory.get_cache_stats()
             print(f"  ✅ Cache stats: {stats_after['total_cached_clients']} total, {stats_after['active_clients']} active")
             
-        except Exception as e:
+        except AWSServiceError as e:
             print(f"  ❌ Client caching test failed: {str(e)}")
         
         # Test 7: Test multiple regions
         print("\n🌐 Testing Multiple Regions:")
         regions_to_test = ['us-east-1', 'us-west-2', 'eu-west-1']
         
-        for region in regions_to_test:
+        async def check_region(region):
+            # Returns (client creation error, caller identity or call error)
             try:
                 sts_client = await client_factory.get_client(
                     service_name="sts",
                     profile_name="default",
                     region=region
                 )
-                print(f"  ✅ STS client created for {region}")
-                
-                # Test with get_caller_identity
-                try:
-                    identity = sts_client.get_caller_identity()
-                    account = identity.get('Account', 'Unknown')
-                    print(f"    Account: {account}")
-                except Exception as e:
-                    print(f"    ⚠️  STS call failed: {str(e)}")
-                    
-            except Exception as e:
-                print(f"  ❌ STS client creation failed for {region}: {str(e)}")
+            except AWSServiceError as e:
+                return e, None
+            
+            # Test with get_caller_identity, off the event loop so regions overlap
+            try:
+                return None, await client_factory.call(sts_client, 'get_caller_identity')
+            except (ClientError, BotoCoreError) as e:
+                return None, e
+        
+        region_results = await asyncio.gather(*(check_region(region) for region in regions_to_test))
+        
+        # Collect the phase's output and print it in one call
+        region_lines = []
+        for region, (creation_error, identity) in zip(regions_to_test, region_results):
+            if creation_error is not None:
+                region_lines.append(f"  ❌ STS client creation failed for {region}: {str(creation_error)}")
+                continue
+            
+            region_lines.append(f"  ✅ STS client created for {region}")
+            if isinstance(identity, Exception):
+                region_lines.append(f"    ⚠️  STS call failed: {str(identity)}")
+            else:
+                account = identity.get('Account', 'Unknown')
+                region_lines.append(f"    Account: {account}")
+        print("\n".join(region_lines))
         
         # Test 8: Test cache cleanup
         print("\n🧹 Testing Cache Cleanup:")
@@ -161,18 +213,20 @@ async def test_client_factory():
                 region="us-east-1"
             )
             print("  ❌ Should have failed with non-existent profile")
-        except AWSProfileNotFoundError:
-            print("  ✅ Correctly handled non-existent profile")
-        except Exception as e:
-            print(f"  ⚠️  Unexpected error (may be normal): {str(e)}")
+        except AWSServiceError as e:
+            # The factory wraps session errors, so check what caused the failure
+            if isinstance(e.__cause__, AWSProfileNotFoundError):
+                print("  ✅ Correctly handled non-existent profile")
+            else:
+                print(f"  ⚠️  Unexpected error (may be normal): {str(e)}")
         
         print("\n" + "=" * 60)
         print("✅ All client factory tests completed!")
         
     except Exception as e:
-        print(f"\n❌ Test suite failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        print(f"\n❌ Test suite failed: {type(e).__name__}: {e}")
+        if VERBOSE:
+            traceback.print_exc()
 
 
 async def test_service_types():
@@ -180,37 +234,38 @@ async def test_service_types():
     print("\n🔧 Testing Service Types:")
     print("=" * 40)
     
-    service_categories = {
-        "Compute": [AWSServiceType.EC2, AWSServiceType.LAMBDA, AWSServiceType.ECS],
-        "Storage": [AWSServiceType.S3, AWSServiceType.EBS, AWSServiceType.EFS],
-        "Database": [AWSServiceType.RDS, AWSServiceType.DYNAMODB],
-        "Security": [AWSServiceType.IAM, AWSServiceType.STS, AWSServiceType.KMS]
-    }
-    
-    for category, services in service_categories.items():
+    for category, services in SERVICE_CATEGORIES:
         print(f"\n{category}:")
         for service in services:
             print(f"  - {service.name}: {service.value}")
 
 
+async def run_tests(client_factory: AWSServiceClientFactory):
+    """Run the service types and client factory tests on one event loop"""
+    # Run service types test first
+    await test_service_types()
+    
+    # Run main client factory tests
+    await test_client_factory(client_factory)
+
+
 def main():
     """Main test function"""
     print("🚀 AWS Client Factory Test Suite")
     print("=" * 60)
     
     try:
-        # Run service types test first
-        asyncio.run(test_service_types())
+        # One factory, backed by the shared session manager, for the whole run
+        client_factory = AWSServiceClientFactory()
         
-        # Run main client factory tests
-        asyncio.run(test_client_factory())
+        asyncio.run(run_tests(client_factory))
         
     except KeyboardInterrupt:
         print("\n\n⏹️  Test suite interrupted by user")
     except Exception as e:
-        print(f"\n❌ Test suite failed with error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        print(f"\n❌ Test suite failed with error: {type(e).__name__}: {e}")
+        if VERBOSE:
+            traceback.print_exc()
 
 
 if __name__ == "__main__":
@@ -6,37 +6,43 @@ This script demonstrates and tests the AWS Session Manager functionality
 including credential validation, session caching, and role assumption.
 """
 import asyncio
+import os
 import sys
-import json
+import traceback
+from itertools import islice
 from pathlib import Path
 
+from botocore.exceptions import BotoCoreError, ClientError
+
 # Add the backend directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "backend"))
 
 from app.aws.session_manager import AWSSessionManager
 from app.aws.credentials import AWSCredentialsReader
-from app.models.aws import AWSSessionError, AWSProfileNotFoundError
+from app.models.aws import AWSSessionError, AWSProfileNotFoundError, AWSProfileCollection, AWSProfileType
+
+# Full tracebacks are only printed when CE_TEST_VERBOSE is set
+VERBOSE = bool(os.environ.get("CE_TEST_VERBOSE"))
 
 
-async def test_session_manager():
+async def test_session_manager(session_manager: AWSSessionManager, profiles: AWSProfileCollection):
     """Test AWS Session Manager functionality"""
     print("🚀 Testing AWS Session Manager...")
     print("=" * 50)
     
-    # Initialize session manager
-    session_manager = AWSSessionManager()
-    
     try:
         # Test 1: Get session manager info
         print("\n📊 Session Manager Information:")
         info = session_manager.get_session_info()
-        print(json.dumps(info, indent=2))
+        print(f"  {info}")
         
         # Test 2: List available profiles
         print("\n👤 Available AWS Profiles:")
-        profiles = session_manager.credentials_reader.read_all_profiles()
-        for profile_name, profile in profiles.profiles.items():
-            print(f"  - {profile_name}: {profile.profile_type.value} ({profile.region or 'no region'})")
+        if profiles.profiles:
+            print("\n".join(
+                f"  - {profile_name}: {profile.profile_type.value} ({profile.region or 'no region'})"
+                for profile_name, profile in profiles.profiles.items()
+            ))
         
         # Test 3: Validate credentials for default profile
         print("\n🔐 Validating Credentials for 'default' profile:")
@@ -60,12 +66,12 @@ async def test_session_manager():
             # Test 5: Test session with STS call
             print("\n🔍 Testing session with STS call:")
             sts_client = session.client('sts')
-            identity = sts_client.get_caller_identity()
+            identity = await asyncio.to_thread(sts_client.get_caller_identity)
             print(f"  ✅ Account ID: {identity.get('Account')}")
             print(f"  ✅ User ID: {identity.get('UserId')}")
             print(f"  ✅ ARN: {identity.get('Arn')}")
             
-        except Exception as e:
+        except (AWSSessionError, AWSProfileNotFoundError, ClientError, BotoCoreError) as e:
             print(f"  ❌ Session creation failed: {str(e)}")
         
         # Test 6: Test session caching
@@ -75,21 +81,26 @@ async def test_session_manager():
             session2 = await session_manager.get_session("default")
             print(f"  ✅ Created two sessions for same profile")
             print(f"  ✅ Cache stats - Active sessions: {session_manager.session_cache.active_session_count}")
-        except Exception as e:
+        except (AWSSessionError, AWSProfileNotFoundError) as e:
             print(f"  ❌ Session caching test failed: {str(e)}")
         
         # Test 7: Test with different profiles (if available)
         print("\n🔄 Testing Multiple Profiles:")
-        profile_names = list(profiles.profiles.keys())
-        for profile_name in profile_names[:3]:  # Test first 3 profiles
-            try:
-                validation = await session_manager.validate_credentials(profile_name)
-                if validation['valid']:
-                    print(f"  ✅ Profile '{profile_name}': Valid")
-                else:
-                    print(f"  ⚠️  Profile '{profile_name}': Invalid - {validation.get('error', 'Unknown error')}")
-            except Exception as e:
-                print(f"  ❌ Profile '{profile_name}': Error - {str(e)}")
+        tested_names = list(islice(profiles.profiles, 3))  # Test first 3 profiles
+        validations = await asyncio.gather(
+            *(session_manager.validate_credentials(profile_name) for profile_name in tested_names),
+            return_exceptions=True
+        )
+        validation_lines = []
+        for profile_name, validation in zip(tested_names, validations):
+            if isinstance(validation, Exception):
+                validation_lines.append(f"  ❌ Profile '{profile_name}': Error - {str(validation)}")
+            elif validation['valid']:
+                validation_lines.append(f"  ✅ Profile '{profile_name}': Valid")
+            else:
+                validation_lines.append(f"  ⚠️  Profile '{profile_name}': Invalid - {validation.get('error', 'Unknown error')}")
+        if validation_lines:
+            print("\n".join(validation_lines))
         
         # Test 8: Test session cleanup
         print("\n🧹 Testing Session Cleanup:")
@@ -109,49 +120,59 @@ async def test_session_manager():
         print("✅ All tests completed successfully!")
         
     except Exception as e:
-        print(f"\n❌ Test suite failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        print(f"\n❌ Test suite failed: {type(e).__name__}: {e}")
+        if VERBOSE:
+            traceback.print_exc()
 
 
-async def test_role_assumption():
+async def test_role_assumption(session_manager: AWSSessionManager, profiles: AWSProfileCollection):
     """Test role assumption if role profiles are available"""
     print("\n🔄 Testing Role Assumption...")
     
-    session_manager = AWSSessionManager()
-    profiles = session_manager.credentials_reader.read_all_profiles()
-    
-    # Look for role profiles
-    role_profiles = [p for p in profiles.profiles.values() 
-                    if p.profile_type.value == "iam_role" and p.role_arn]
+    # Look for the first role profile; the scan stops at the first match
+    role_profile = next(
+        (p for p in profiles.profiles.values() if p.profile_type is AWSProfileType.IAM_ROLE and p.role_arn),
+        None
+    )
     
-    if not role_profiles:
+    if role_profile is None:
         print("  ⚠️  No IAM role profiles found for testing")
         return
     
-    for role_profile in role_profiles[:1]:  # Test first role profile
-        print(f"  🎭 Testing role assumption for: {role_profile.name}")
-        print(f"      Role ARN: {role_profile.role_arn}")
-        print(f"      Source Profile: {role_profile.source_profile}")
+    print(f"  🎭 Testing role assumption for: {role_profile.name}")
+    print(f"      Role ARN: {role_profile.role_arn}")
+    print(f"      Source Profile: {role_profile.source_profile}")
+    
+    try:
+        role_session = await session_manager.assume_role(
+            role_arn=role_profile.role_arn,
+            source_profile=role_profile.source_profile,
+            duration_seconds=role_profile.duration_seconds,
+            external_id=role_profile.external_id,
+            mfa_serial=role_profile.mfa_serial
+        )
         
-        try:
-            role_session = await session_manager.assume_role(
-                role_arn=role_profile.role_arn,
-                source_profile=role_profile.source_profile,
-                duration_seconds=role_profile.duration_seconds,
-                external_id=role_profile.external_id,
-                mfa_serial=role_profile.mfa_serial
-            )
-            
-            # Test the role session
-            sts_client = role_session.client('sts')
-            identity = sts_client.get_caller_identity()
-            print(f"  ✅ Role assumption successful!")
-            print(f"      Assumed ARN: {identity.get('Arn')}")
-            print(f"      Account: {identity.get('Account')}")
-            
-        except Exception as e:
-            print(f"  ❌ Role assumption failed: {str(e)}")
+        # Test the role session
+        sts_client = role_session.client('sts')
+        identity = await asyncio.to_thread(sts_client.get_caller_identity)
+        print(f"  ✅ Role assumption successful!")
+        print(f"      Assumed ARN: {identity.get('Arn')}")
+        print(f"      Account: {identity.get('Account')}")
+        
+    except (AWSSessionError, ClientError, BotoCoreError) as e:
+        print(f"  ❌ Role assumption failed: {str(e)}")
+
+
+async def run_tests(session_manager: AWSSessionManager):
+    """Run the session manager and role assumption tests on one event loop"""
+    # Both tests work from one read of the profiles
+    profiles = session_manager.credentials_reader.read_all_profiles()
+    
+    # Run basic session manager tests
+    await test_session_manager(session_manager, profiles)
+    
+    # Run role assumption tests
+    await test_role_assumption(session_manager, profiles)
 
 
 def main():
@@ -160,18 +181,18 @@ def main():
     print("=" * 50)
     
     try:
-        # Run basic session manager tests
-        asyncio.run(test_session_manager())
+        # One session manager for both tests, so parsed profiles and cached
+        # sessions carry over to the role assumption test
+        session_manager = AWSSessionManager()
         
-        # Run role assumption tests
-        asyncio.run(test_role_assumption())
+        asyncio.run(run_tests(session_manager))
         
     except KeyboardInterrupt:
         print("\n\n⛔ Tests interrupted by user")
     except Exception as e:
-        print(f"\n❌ Test suite failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        print(f"\n❌ Test suite failed: {type(e).__name__}: {e}")
+        if VERBOSE:
+            traceback.print_exc()
         sys.exit(1)
 
 